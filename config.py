@@ -1,14 +1,28 @@
 """
 Configuration management for Astro Session Viewer.
 """
+import functools
 import json
+import os
 from pathlib import Path
 from typing import Optional
 import sys
 
+from PyQt6.QtCore import QCoreApplication, QTimer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> Path:
-    """Get the configuration directory for the application."""
+    """Get the configuration directory for the application.
+
+    The directory is created on the first call if missing; the result
+    is cached.
+    """
     if sys.platform == 'win32':
         # Windows: Use AppData/Local
         base = Path.home() / 'AppData' / 'Local'
@@ -20,138 +34,271 @@ def get_config_dir() -> Path:
         base = Path.home() / '.config'
 
     config_dir = base / 'AstroSessionViewer'
-    config_dir.mkdir(parents=True, exist_ok=True)
+    # One stat in the common case where the directory already exists
+    if not config_dir.is_dir():
+        config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """Get the path to the config file."""
     return get_config_dir() / 'config.json'
 
 
+def _optional_str(value) -> Optional[str]:
+    """Validate an optional string setting."""
+    if value is None or isinstance(value, str):
+        return value or None
+    raise TypeError(f"expected a string, got {type(value).__name__}")
+
+
+def _optional_dict(value) -> Optional[dict]:
+    """Validate an optional mapping setting."""
+    if value is None or isinstance(value, dict):
+        return value
+    raise TypeError(f"expected an object, got {type(value).__name__}")
+
+
+def _strict_bool(value) -> bool:
+    """Validate a boolean setting."""
+    if isinstance(value, bool):
+        return value
+    raise TypeError(f"expected a boolean, got {type(value).__name__}")
+
+
 class Config:
-    """Application configuration with persistence."""
+    """Application configuration with persistence.
+
+    Property setters only update the in-memory values and schedule a
+    deferred save, so a burst of changes results in a single write.
+    Call flush() to write pending changes immediately.
+    """
+
+    # __weakref__ lets the save timer connect to the bound flush()
+    __slots__ = ('_config', '_path', '_dirty', '_save_timer',
+                 '_nina_folder', '_phd2_folder', '__weakref__')
+
+    # Delay before pending changes are written to disk
+    SAVE_DELAY_MS = 200
+
+    # Converters applied to values read from the config file
+    _VALIDATORS = {
+        'nina_folder': _optional_str,
+        'phd2_folder': _optional_str,
+        'dither_margin': float,
+        'exclude_dither': _strict_bool,
+        'granularity_minutes': int,
+        'window_geometry': _optional_dict,
+        'imaging_pixel_scale': float,
+    }
+
+    _DEFAULTS = {
+        'nina_folder': None,
+        'phd2_folder': None,
+        'dither_margin': 3.0,
+        'exclude_dither': True,
+        'granularity_minutes': 1,
+        'window_geometry': None,
+        'imaging_pixel_scale': 1.0,  # arcsec/px for the imaging system
+    }
 
     def __init__(self):
-        self._config = {
-            'nina_folder': None,
-            'phd2_folder': None,
-            'dither_margin': 3.0,
-            'exclude_dither': True,
-            'granularity_minutes': 1,
-            'window_geometry': None,
-            'imaging_pixel_scale': 1.0,  # arcsec/px for the imaging system
-        }
+        # Every known key is always present, so getters can index directly
+        self._config = dict(self._DEFAULTS)
+        self._path = get_config_path()
+        self._dirty = False
+        self._save_timer: Optional[QTimer] = None
+        # Path objects for the folder settings, built once
+        self._nina_folder: Optional[Path] = None
+        self._phd2_folder: Optional[Path] = None
         self.load()
 
     def load(self) -> None:
         """Load configuration from file."""
-        config_path = get_config_path()
+        config_path = self._path
         if config_path.exists():
             try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    saved = json.load(f)
-                    self._config.update(saved)
-            except (json.JSONDecodeError, IOError):
+                data = config_path.read_bytes()
+                # json.loads accepts bytes directly and detects the encoding
+                saved = orjson.loads(data) if orjson else json.loads(data)
+            except (ValueError, IOError):
                 # If config is corrupted, use defaults
-                pass
+                # (orjson.JSONDecodeError and json.JSONDecodeError are ValueErrors)
+                saved = None
+            if isinstance(saved, dict):
+                self._apply_saved(saved)
+        self._update_folder_paths()
+
+    def _apply_saved(self, saved: dict) -> None:
+        """Merge saved values, coercing known keys and dropping invalid ones."""
+        for key, value in saved.items():
+            validator = self._VALIDATORS.get(key)
+            if validator is None:
+                # Keep unknown keys so they survive a save
+                self._config[key] = value
+                continue
+            try:
+                self._config[key] = validator(value)
+            except (TypeError, ValueError):
+                pass  # Keep the default
+
+    def _update_folder_paths(self) -> None:
+        """Rebuild the cached folder Path objects from the raw values."""
+        nina_folder = self._config['nina_folder']
+        phd2_folder = self._config['phd2_folder']
+        self._nina_folder = Path(nina_folder) if nina_folder else None
+        self._phd2_folder = Path(phd2_folder) if phd2_folder else None
 
     def save(self) -> None:
-        """Save configuration to file."""
-        config_path = get_config_path()
+        """Save configuration to file.
+
+        The data is written to a temporary file which then replaces the
+        config file, so an interrupted write never leaves a truncated config.
+        """
+        self._dirty = False
+        config_path = self._path
+        if orjson:
+            payload = orjson.dumps(self._config, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self._config, indent=2).encode('utf-8')
+        tmp_path = config_path.with_suffix('.json.tmp')
         try:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2)
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, config_path)
         except IOError:
             pass  # Silently fail if we can't write
 
+    def update(self, **values) -> None:
+        """Set several config values at once with a single save."""
+        unknown = set(values) - set(self._config)
+        if unknown:
+            raise KeyError(f"Unknown config keys: {', '.join(sorted(unknown))}")
+        for key in ('nina_folder', 'phd2_folder'):
+            if key in values:
+                values[key] = str(values[key]) if values[key] else None
+        self._config.update(values)
+        self._update_folder_paths()
+        self._schedule_save()
+
+    def flush(self) -> None:
+        """Write any pending changes to disk immediately."""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        if self._dirty:
+            self.save()
+
+    def _schedule_save(self) -> None:
+        """Mark the config as changed and (re)start the deferred save."""
+        self._dirty = True
+        if QCoreApplication.instance() is None:
+            # No event loop to drive the timer, write through
+            self.save()
+            return
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(self.SAVE_DELAY_MS)
+            self._save_timer.timeout.connect(self.flush)
+        self._save_timer.start()
+
     @property
     def nina_folder(self) -> Optional[Path]:
         """Get the NINA logs folder path."""
-        path = self._config.get('nina_folder')
-        return Path(path) if path else None
+        return self._nina_folder
 
     @nina_folder.setter
     def nina_folder(self, value: Optional[Path]) -> None:
         """Set the NINA logs folder path."""
         self._config['nina_folder'] = str(value) if value else None
-        self.save()
+        self._nina_folder = Path(value) if value else None
+        self._schedule_save()
 
     @property
     def phd2_folder(self) -> Optional[Path]:
         """Get the PHD2 logs folder path."""
-        path = self._config.get('phd2_folder')
-        return Path(path) if path else None
+        return self._phd2_folder
 
     @phd2_folder.setter
     def phd2_folder(self, value: Optional[Path]) -> None:
         """Set the PHD2 logs folder path."""
         self._config['phd2_folder'] = str(value) if value else None
-        self.save()
+        self._phd2_folder = Path(value) if value else None
+        self._schedule_save()
 
     @property
     def dither_margin(self) -> float:
         """Get the dither margin in seconds."""
-        return self._config.get('dither_margin', 3.0)
+        return self._config['dither_margin']
 
     @dither_margin.setter
     def dither_margin(self, value: float) -> None:
         """Set the dither margin in seconds."""
         self._config['dither_margin'] = value
-        self.save()
+        self._schedule_save()
 
     @property
     def exclude_dither(self) -> bool:
         """Get whether to exclude dither from RMS calculations."""
-        return self._config.get('exclude_dither', True)
+        return self._config['exclude_dither']
 
     @exclude_dither.setter
     def exclude_dither(self, value: bool) -> None:
         """Set whether to exclude dither from RMS calculations."""
         self._config['exclude_dither'] = value
-        self.save()
+        self._schedule_save()
 
     @property
     def granularity_minutes(self) -> int:
         """Get the RMS chart granularity in minutes."""
-        return self._config.get('granularity_minutes', 1)
+        return self._config['granularity_minutes']
 
     @granularity_minutes.setter
     def granularity_minutes(self, value: int) -> None:
         """Set the RMS chart granularity in minutes."""
         self._config['granularity_minutes'] = value
-        self.save()
+        self._schedule_save()
 
     @property
     def window_geometry(self) -> Optional[dict]:
         """Get the saved window geometry."""
-        return self._config.get('window_geometry')
+        return self._config['window_geometry']
 
     @window_geometry.setter
     def window_geometry(self, value: Optional[dict]) -> None:
         """Set the window geometry."""
         self._config['window_geometry'] = value
-        self.save()
+        self._schedule_save()
+
+    def set_window_geometry(self, value: Optional[dict], defer: bool = True) -> None:
+        """Set the window geometry.
+
+        With defer=True only the in-memory value is updated; it is written
+        by the next save or flush(). Intended for frequent updates such as
+        move/resize tracking.
+        """
+        self._config['window_geometry'] = value
+        if defer:
+            self._dirty = True
+        else:
+            self._schedule_save()
 
     @property
     def imaging_pixel_scale(self) -> float:
         """Get the imaging system pixel scale in arcsec/px."""
-        return self._config.get('imaging_pixel_scale', 1.0)
+        return self._config['imaging_pixel_scale']
 
     @imaging_pixel_scale.setter
     def imaging_pixel_scale(self, value: float) -> None:
         """Set the imaging system pixel scale in arcsec/px."""
         self._config['imaging_pixel_scale'] = value
-        self.save()
-
-
-# Global config instance
-_config: Optional[Config] = None
+        self._schedule_save()
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> Config:
     """Get the global config instance."""
-    global _config
-    if _config is None:
-        _config = Config()
-    return _config
+    return Config()
@@ -1,6 +1,7 @@
 """
 Main window for the Astro Session Viewer application.
 """
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
@@ -9,10 +10,10 @@ from PyQt6.QtWidgets import (
     QTabWidget, QFileDialog, QPushButton, QLabel, QFrame,
     QStatusBar, QToolBar, QMessageBox, QGroupBox, QDialog
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QAction, QIcon
 
-from parsers import PHD2Parser, NINAParser, match_session_logs, correlate_guiding_with_exposures
+from parsers import PHD2Parser, NINAParser, correlate_guiding_with_exposures
 from widgets import (
     SessionSummaryWidget, GuidingChartWidget, HFRChartWidget,
     AutofocusTableWidget, ExposuresTableWidget, EventsListWidget,
@@ -21,9 +22,41 @@ from widgets import (
 from config import get_config
 
 
+class _ParseSignals(QObject):
+    """Signals for _ParseJob (QRunnable is not a QObject)."""
+
+    finished = pyqtSignal(object)  # dict of cache key -> parser
+    failed = pyqtSignal(str)
+
+
+class _ParseJob(QRunnable):
+    """Parses log files on a QThreadPool worker thread."""
+
+    def __init__(self, keys: list[tuple]):
+        super().__init__()
+        self.signals = _ParseSignals()
+        self._keys = keys  # MainWindow parser cache keys
+
+    def run(self):
+        results = {}
+        try:
+            for key in self._keys:
+                parser_cls, path = key[:2]
+                parser = parser_cls()
+                parser.parse(path)
+                results[key] = parser
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(results)
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    # Number of parsed log files kept around for quick reloads
+    PARSER_CACHE_SIZE = 4
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Astro Session Viewer")
@@ -33,6 +66,19 @@ class MainWindow(QMainWindow):
         self._nina_parser: Optional[NINAParser] = None
         self._phd2_path: Optional[Path] = None
         self._nina_path: Optional[Path] = None
+        # (dither_margin, exclude_dither, phd2_parser, nina_parser) the
+        # exposures were last correlated for; skips redundant passes
+        self._last_correlation_key: Optional[tuple] = None
+        # Set while _update_widgets runs so chart signals don't re-enter
+        self._updating = False
+        # (parser class, path, mtime_ns, size) -> parsed parser, oldest first
+        self._parser_cache: OrderedDict[tuple, object] = OrderedDict()
+        # Background parse in progress and the cache keys it will resolve
+        self._parse_job: Optional[_ParseJob] = None
+        self._pending_keys: tuple[Optional[tuple], Optional[tuple]] = (None, None)
+        # Log file dialog, created on first use and shared by both browse actions
+        self._file_dialog: Optional[QFileDialog] = None
+        self._file_dialog_handler = None
 
         # Load config
         self._config = get_config()
@@ -190,22 +236,22 @@ class MainWindow(QMainWindow):
         # File menu
         file_menu = menubar.addMenu("&File")
 
-        load_session_action = QAction("&Load Session...", self)
-        load_session_action.setShortcut("Ctrl+O")
-        load_session_action.triggered.connect(self._show_session_selector)
-        file_menu.addAction(load_session_action)
+        self.load_session_action = QAction("&Load Session...", self)
+        self.load_session_action.setShortcut("Ctrl+O")
+        self.load_session_action.triggered.connect(self._show_session_selector)
+        file_menu.addAction(self.load_session_action)
 
         file_menu.addSeparator()
 
-        open_phd2_action = QAction("Open PHD2 Log...", self)
-        open_phd2_action.setShortcut("Ctrl+Shift+P")
-        open_phd2_action.triggered.connect(self._browse_phd2)
-        file_menu.addAction(open_phd2_action)
+        self.open_phd2_action = QAction("Open PHD2 Log...", self)
+        self.open_phd2_action.setShortcut("Ctrl+Shift+P")
+        self.open_phd2_action.triggered.connect(self._browse_phd2)
+        file_menu.addAction(self.open_phd2_action)
 
-        open_nina_action = QAction("Open NINA Log...", self)
-        open_nina_action.setShortcut("Ctrl+Shift+N")
-        open_nina_action.triggered.connect(self._browse_nina)
-        file_menu.addAction(open_nina_action)
+        self.open_nina_action = QAction("Open NINA Log...", self)
+        self.open_nina_action.setShortcut("Ctrl+Shift+N")
+        self.open_nina_action.triggered.connect(self._browse_nina)
+        file_menu.addAction(self.open_nina_action)
 
         file_menu.addSeparator()
 
@@ -266,59 +312,114 @@ class MainWindow(QMainWindow):
 
     def _browse_phd2(self):
         """Open file dialog for PHD2 log."""
-        start_dir = str(self._phd2_folder) if self._phd2_folder else ""
-        filepath, _ = QFileDialog.getOpenFileName(
-            self,
+        self._open_log_dialog(
             "Select PHD2 Guide Log",
-            start_dir,
-            "PHD2 Log Files (PHD2_GuideLog*.txt);;All Files (*.*)"
+            self._phd2_folder,
+            ["PHD2 Log Files (PHD2_GuideLog*.txt)", "All Files (*.*)"],
+            self._set_phd2_path
         )
-        if filepath:
-            self._phd2_path = Path(filepath)
-            self._phd2_folder = self._phd2_path.parent
-            self._config.phd2_folder = self._phd2_folder
-            self.phd2_label.setText(self._phd2_path.name)
-            self._update_load_button()
 
     def _browse_nina(self):
         """Open file dialog for NINA log."""
-        start_dir = str(self._nina_folder) if self._nina_folder else ""
-        filepath, _ = QFileDialog.getOpenFileName(
-            self,
+        self._open_log_dialog(
             "Select NINA Log",
-            start_dir,
-            "NINA Log Files (*.log);;All Files (*.*)"
+            self._nina_folder,
+            ["NINA Log Files (*.log)", "All Files (*.*)"],
+            self._set_nina_path
         )
-        if filepath:
-            self._nina_path = Path(filepath)
-            self._nina_folder = self._nina_path.parent
-            self._config.nina_folder = self._nina_folder
-            self.nina_label.setText(self._nina_path.name)
-            self._update_load_button()
+
+    def _open_log_dialog(self, title: str, folder: Optional[Path], name_filters: list[str], on_selected):
+        """Show the shared log file dialog and pass the chosen path to on_selected."""
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+            self._file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._file_dialog.fileSelected.connect(self._on_log_file_selected)
+
+        dialog = self._file_dialog
+        dialog.setWindowTitle(title)
+        dialog.setNameFilters(name_filters)
+        if folder:
+            dialog.setDirectory(str(folder))
+        self._file_dialog_handler = on_selected
+        dialog.open()
+
+    def _on_log_file_selected(self, filepath: str):
+        """Handle a file chosen in the shared log file dialog."""
+        if filepath and self._file_dialog_handler:
+            self._file_dialog_handler(Path(filepath))
+
+    def _set_phd2_path(self, path: Path):
+        """Select a PHD2 log and remember its folder."""
+        self._phd2_path = path
+        self._phd2_folder = path.parent
+        self._config.phd2_folder = self._phd2_folder
+        self.phd2_label.setText(path.name)
+        self._update_load_button()
+
+    def _set_nina_path(self, path: Path):
+        """Select a NINA log and remember its folder."""
+        self._nina_path = path
+        self._nina_folder = path.parent
+        self._config.nina_folder = self._nina_folder
+        self.nina_label.setText(path.name)
+        self._update_load_button()
 
     def _update_load_button(self):
         """Enable load button if at least one file is selected."""
         self.load_btn.setEnabled(
-            self._phd2_path is not None or self._nina_path is not None
+            self._parse_job is None
+            and (self._phd2_path is not None or self._nina_path is not None)
         )
 
     def _load_session(self):
-        """Load and parse the selected log files."""
+        """Load the selected log files, parsing them in the background."""
+        if self._parse_job is not None:
+            return  # Already loading
+
         self.statusbar.showMessage("Loading session data...")
 
         try:
-            # Parse PHD2 log
-            if self._phd2_path:
-                self._phd2_parser = PHD2Parser()
-                self._phd2_parser.parse(self._phd2_path)
+            phd2_key = self._parser_key(PHD2Parser, self._phd2_path) if self._phd2_path else None
+            nina_key = self._parser_key(NINAParser, self._nina_path) if self._nina_path else None
+        except OSError as e:
+            self._show_load_error(e)
+            return
+
+        self._pending_keys = (phd2_key, nina_key)
+        missing = [key for key in self._pending_keys if key and key not in self._parser_cache]
+        if not missing:
+            self._on_parse_finished({})
+            return
+
+        job = _ParseJob(missing)
+        job.signals.finished.connect(self._on_parse_finished)
+        job.signals.failed.connect(self._on_parse_failed)
+        self._parse_job = job
+        self._set_loading(True)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_parse_finished(self, results: dict):
+        """Install freshly parsed (or cached) parsers and refresh the widgets."""
+        self._parse_job = None
+        self._set_loading(False)
+
+        self._parser_cache.update(results)
+        phd2_key, nina_key = self._pending_keys
+        for key in (phd2_key, nina_key):
+            if key:
+                self._parser_cache.move_to_end(key)
+        while len(self._parser_cache) > self.PARSER_CACHE_SIZE:
+            self._parser_cache.popitem(last=False)
+
+        try:
+            if phd2_key:
+                self._phd2_parser = self._parser_cache[phd2_key]
                 self.statusbar.showMessage(
                     f"Loaded {len(self._phd2_parser.sessions)} guiding sessions"
                 )
 
-            # Parse NINA log
-            if self._nina_path:
-                self._nina_parser = NINAParser()
-                self._nina_parser.parse(self._nina_path)
+            if nina_key:
+                self._nina_parser = self._parser_cache[nina_key]
                 self.statusbar.showMessage(
                     f"Loaded {len(self._nina_parser.exposures)} exposures, "
                     f"{len(self._nina_parser.autofocus_runs)} autofocus runs"
@@ -330,12 +431,37 @@ class MainWindow(QMainWindow):
             self.statusbar.showMessage("Session loaded successfully")
 
         except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Error Loading Session",
-                f"Failed to parse log files:\n\n{str(e)}"
-            )
-            self.statusbar.showMessage("Error loading session")
+            self._show_load_error(e)
+
+    def _on_parse_failed(self, message: str):
+        """Handle a parse error reported by the background job."""
+        self._parse_job = None
+        self._set_loading(False)
+        self._show_load_error(message)
+
+    def _show_load_error(self, error):
+        """Report a failure to load the session."""
+        QMessageBox.critical(
+            self,
+            "Error Loading Session",
+            f"Failed to parse log files:\n\n{str(error)}"
+        )
+        self.statusbar.showMessage("Error loading session")
+
+    def _set_loading(self, loading: bool):
+        """Disable the load and open controls while a background parse is running."""
+        # Anything that changes the selected logs waits for the parse
+        for widget in (
+            self.quick_load_btn, self.phd2_browse_btn, self.nina_browse_btn,
+            self.load_session_action, self.open_phd2_action, self.open_nina_action,
+        ):
+            widget.setEnabled(not loading)
+        self._update_load_button()
+
+    def _parser_key(self, parser_cls, path: Path) -> tuple:
+        """Cache key identifying a parsed log file."""
+        stat = path.stat()
+        return (parser_cls, path, stat.st_mtime_ns, stat.st_size)
 
     def _update_widgets(self):
         """Update all widgets with parsed data."""
@@ -344,34 +470,45 @@ class MainWindow(QMainWindow):
         exclude_dither = self.guiding_chart.is_dither_excluded()
 
         # Correlate guiding data with exposures if both datasets available
-        if self._phd2_parser and self._nina_parser:
+        key = (dither_margin, exclude_dither, self._phd2_parser, self._nina_parser)
+        if self._phd2_parser and self._nina_parser and key != self._last_correlation_key:
             dither_events = self._nina_parser.dither_events if exclude_dither else None
             correlate_guiding_with_exposures(
                 self._phd2_parser, self._nina_parser,
                 dither_events=dither_events,
                 dither_margin_seconds=dither_margin
             )
+        self._last_correlation_key = key
 
-        # Summary
-        self.summary_widget.update_data(
-            self._phd2_parser, self._nina_parser,
-            dither_margin=dither_margin, exclude_dither=exclude_dither
-        )
+        # Refresh everything with a single repaint at the end
+        central_widget = self.centralWidget()
+        central_widget.setUpdatesEnabled(False)
+        self._updating = True
+        try:
+            # Summary
+            self.summary_widget.update_data(
+                self._phd2_parser, self._nina_parser,
+                dither_margin=dither_margin, exclude_dither=exclude_dither
+            )
 
-        # Events
-        self.events_widget.set_data(self._phd2_parser, self._nina_parser)
+            # Events
+            self.events_widget.set_data(self._phd2_parser, self._nina_parser)
 
-        # Charts
-        if self._phd2_parser:
-            self.guiding_chart.set_data(self._phd2_parser, self._nina_parser)
-            self.guiding_sessions_table.set_data(self._phd2_parser)
+            # Charts
+            if self._phd2_parser:
+                self.guiding_chart.set_data(self._phd2_parser, self._nina_parser)
+                self.guiding_sessions_table.set_data(self._phd2_parser)
 
-        if self._nina_parser:
-            self.hfr_chart.set_data(self._nina_parser)
-            # Apply imaging pixel scale for color coding
-            self.exposures_table.set_imaging_pixel_scale(self._config.imaging_pixel_scale)
-            self.exposures_table.set_data(self._nina_parser)
-            self.autofocus_table.set_data(self._nina_parser)
+            if self._nina_parser:
+                self.hfr_chart.set_data(self._nina_parser)
+                # Apply imaging pixel scale for color coding
+                self.exposures_table.set_imaging_pixel_scale(self._config.imaging_pixel_scale)
+                self.exposures_table.set_data(self._nina_parser)
+                self.autofocus_table.set_data(self._nina_parser)
+        finally:
+            self._updating = False
+            central_widget.setUpdatesEnabled(True)
+            central_widget.update()
 
     def _on_granularity_changed(self, index: int):
         """Handle granularity change from chart widget."""
@@ -381,9 +518,20 @@ class MainWindow(QMainWindow):
 
     def _on_dither_settings_changed(self, margin: float, exclude: bool):
         """Handle dither settings change from chart widget."""
+        # Emitted by the chart while _update_widgets is populating it;
+        # that pass already correlates and refreshes the summary
+        if self._updating:
+            return
+
         # Save settings to config
-        self._config.dither_margin = margin
-        self._config.exclude_dither = exclude
+        self._config.update(dither_margin=margin, exclude_dither=exclude)
+
+        # Nothing to recompute if the effective settings did not change
+        # (e.g. a granularity change also emits this signal)
+        key = (margin, exclude, self._phd2_parser, self._nina_parser)
+        if key == self._last_correlation_key:
+            return
+        self._last_correlation_key = key
 
         if self._phd2_parser and self._nina_parser:
             # Recorrelate guiding data with new dither settings
@@ -461,14 +609,15 @@ class MainWindow(QMainWindow):
     def _save_window_geometry(self):
         """Save window geometry to config."""
         geo = self.geometry()
-        self._config.window_geometry = {
+        self._config.set_window_geometry({
             'x': geo.x(),
             'y': geo.y(),
             'width': geo.width(),
             'height': geo.height()
-        }
+        })
 
     def closeEvent(self, event):
         """Handle window close event."""
         self._save_window_geometry()
+        self._config.flush()
         super().closeEvent(event)
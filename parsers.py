@@ -1,32 +1,55 @@
 """
 Log parsers for PHD2 and NINA log files.
 """
+import functools
+import mmap
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import numpy as np
 
 
-@dataclass
-class GuidingFrame:
-    """Single guiding frame data from PHD2."""
-    frame: int
-    time: float
-    dx: float
-    dy: float
-    ra_raw: float
-    dec_raw: float
-    ra_guide: float
-    dec_guide: float
-    ra_duration: int
-    dec_duration: int
-    ra_direction: str
-    dec_direction: str
-    star_mass: float
-    snr: float
-    error_code: int
+# PHD2 guide log patterns
+_PHD2_LOG_ENABLED_RE = re.compile(r'Log enabled at (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
+_PHD2_GUIDING_BEGINS_RE = re.compile(r'Guiding Begins at (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
+_PHD2_GUIDING_ENDS_RE = re.compile(r'Guiding Ends at (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
+_PHD2_PROFILE_RE = re.compile(r'Equipment Profile = (.+)')
+_PHD2_PIXEL_SCALE_RE = re.compile(r'Pixel scale = ([\d.]+).*Focal length = (\d+)')
+_PHD2_MOUNT_RE = re.compile(
+    r'RA = ([\d.]+) hr, Dec = ([-\d.]+) deg, Hour angle = ([-\d.]+) hr, '
+    r'Pier side = (\w+).*Alt = ([\d.]+) deg, Az = ([\d.]+) deg'
+)
+_PHD2_HEADER_PREFIXES = (
+    "PHD2 version", "Guiding Begins at", "Equipment Profile", "Pixel scale", "RA =", "Guiding Ends at"
+)
+
+# A guiding frame line with its required fields present: frame, time,
+# (mount), dx, dy and the RA/Dec raw and guide distances. Star-lost
+# lines leave them empty
+_PHD2_FRAME_RE = re.compile(r'\d+,[^,]+,[^,]*(?:,[^,]+){6},')
+# Frame line fields stored per session: time, RA raw, Dec raw, SNR
+_PHD2_FRAME_COLUMNS = (1, 5, 6, 16)
+
+# NINA log patterns
+_NINA_TARGET_RE = re.compile(r'Target:\s*(.+?)\s+RA:')
+_NINA_AF_INITIAL_RE = re.compile(r'initial position (\d+)')
+_NINA_AF_TRIGGER_RE = re.compile(r'Trigger: (AutofocusAfter\w+)')
+_NINA_AF_TEMPERATURE_RE = re.compile(r'Temperature ([\d.]+)')
+_NINA_AF_FINAL_RE = re.compile(r'ending at (\d+)')
+_NINA_HFR_RE = re.compile(r'Average HFR: ([\d.]+).*Detected Stars (\d+)')
+_NINA_FILTER_RE = re.compile(r'Moving to Filter (\w+) at Position (\d+)')
+_NINA_EXPOSURE_RE = re.compile(
+    r'Exposure Time: ([\d.]+)s; Filter: (\w*); Gain: (\d+); Offset (\d+); Binning: (\d+x\d+)'
+)
+_NINA_SAVED_RE = re.compile(r'Saved image to (.+\.fits)')
+_NINA_PIER_SIDE_RE = re.compile(r'pier side pier(\w+)')
+_NINA_RMS_ALERT_RE = re.compile(r'Total RMS above threshold \(([\d.]+) / ([\d.]+)\)')
 
 
 @dataclass
@@ -43,32 +66,47 @@ class GuidingSession:
     pier_side: str = ""
     altitude: float = 0.0
     azimuth: float = 0.0
-    frames: list = field(default_factory=list)
+    # Per-frame columns, one entry per guiding frame
+    frame_time: np.ndarray = field(default_factory=lambda: np.empty(0))  # seconds since start_time
+    ra_raw: np.ndarray = field(default_factory=lambda: np.empty(0))  # pixels
+    dec_raw: np.ndarray = field(default_factory=lambda: np.empty(0))  # pixels
+    snr: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    @functools.cached_property
+    def frame_timestamps_ns(self) -> np.ndarray:
+        """Absolute time of each frame in nanoseconds since the epoch.
+
+        Computed on first use; frames are not modified after parsing.
+        """
+        return _timestamp_ns(self.start_time) + np.round(self.frame_time * 1e9).astype(np.int64)
+
+    @property
+    def frame_count(self) -> int:
+        """Number of guiding frames."""
+        return len(self.frame_time)
 
     @property
     def ra_rms(self) -> float:
         """RA RMS in arcseconds."""
-        if not self.frames:
+        if not self.frame_count:
             return 0.0
-        ra_values = [f.ra_raw for f in self.frames]
         # Raw values are in pixels, multiply by pixel_scale to get arcseconds
-        rms_px = float(np.sqrt(np.mean(np.square(ra_values))))
+        rms_px = float(np.sqrt(np.mean(np.square(self.ra_raw))))
         return rms_px * self.pixel_scale if self.pixel_scale else rms_px
 
     @property
     def dec_rms(self) -> float:
         """Dec RMS in arcseconds."""
-        if not self.frames:
+        if not self.frame_count:
             return 0.0
-        dec_values = [f.dec_raw for f in self.frames]
         # Raw values are in pixels, multiply by pixel_scale to get arcseconds
-        rms_px = float(np.sqrt(np.mean(np.square(dec_values))))
+        rms_px = float(np.sqrt(np.mean(np.square(self.dec_raw))))
         return rms_px * self.pixel_scale if self.pixel_scale else rms_px
 
     @property
     def total_rms(self) -> float:
         """Total RMS in arcseconds."""
-        if not self.frames:
+        if not self.frame_count:
             return 0.0
         return float(np.sqrt(self.ra_rms**2 + self.dec_rms**2))
 
@@ -150,106 +188,204 @@ class DitherEvent:
         return 0.0
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_nina_seconds(ts_str: str) -> datetime:
+    """Parse the whole-second part of a NINA timestamp (YYYY-MM-DDTHH:MM:SS).
+
+    Raises ValueError if a field is not all digits or the date is invalid.
+    """
+    # int() would also accept a sign or surrounding spaces
+    fields = ts_str[0:4] + ts_str[5:7] + ts_str[8:10] + ts_str[11:13] + ts_str[14:16] + ts_str[17:19]
+    if not fields.isdigit():
+        raise ValueError(f"Invalid NINA timestamp: {ts_str!r}")
+    return datetime(
+        int(ts_str[0:4]), int(ts_str[5:7]), int(ts_str[8:10]),
+        int(ts_str[11:13]), int(ts_str[14:16]), int(ts_str[17:19])
+    )
+
+
+def _read_lines(filepath: str | Path, max_bytes: Optional[int] = None) -> Iterator[str]:
+    """Yield the lines of a log file.
+
+    The file is memory-mapped and decoded line by line, splitting on '\n'
+    (and '\r\n') only; undecodable bytes are dropped. With max_bytes only
+    the complete lines within the last max_bytes of the file are read.
+    """
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return  # Empty files can't be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if max_bytes is not None and size > max_bytes:
+                # Skip the partial line the window starts in
+                start = mm.find(b'\n', size - max_bytes)
+                if start < 0:
+                    return
+                mm.seek(start + 1)
+            for line in iter(mm.readline, b''):
+                yield line.decode('utf-8', 'ignore').removesuffix('\n').removesuffix('\r')
+
+
+def _is_number(text: str) -> bool:
+    """Check if a string parses as a float."""
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _timestamp_ns(dt: datetime) -> int:
+    """Get nanoseconds since the epoch for a naive local datetime."""
+    return int(dt.replace(microsecond=0).timestamp()) * 1_000_000_000 + dt.microsecond * 1000
+
+
+def _dither_mask(
+    times_ns: np.ndarray,
+    dither_events: list,
+    margin_seconds: float
+) -> np.ndarray:
+    """Get a mask of the times (epoch nanoseconds) within a dither event (with margin)."""
+    if not dither_events:
+        return np.zeros(len(times_ns), dtype=bool)
+    margin = timedelta(seconds=margin_seconds)
+    starts = np.array([_timestamp_ns(d.start_time - margin) for d in dither_events], dtype=np.int64)
+    ends = np.array(
+        [_timestamp_ns((d.end_time or d.start_time) + margin) for d in dither_events], dtype=np.int64
+    )
+    order = np.argsort(starts)
+    starts = starts[order]
+    # Latest end among the windows starting at or before each start, so
+    # overlapping windows are handled
+    ends = np.maximum.accumulate(ends[order])
+
+    # Last window starting at or before each time, if it has not ended yet
+    idx = np.searchsorted(starts, times_ns, side='right') - 1
+    return (idx >= 0) & (times_ns <= ends[np.maximum(idx, 0)])
+
+
 class PHD2Parser:
     """Parser for PHD2 guide log files."""
 
     def __init__(self):
         self.sessions: list[GuidingSession] = []
         self.log_date: Optional[datetime] = None
+        # (dither_events, (event count, margin), per-session masks) of the last mask build
+        self._dither_mask_cache: Optional[tuple] = None
 
     def parse(self, filepath: str | Path) -> list[GuidingSession]:
         """Parse a PHD2 guide log file."""
         self.sessions = []
+        self._dither_mask_cache = None
         current_session: Optional[GuidingSession] = None
+        # Session line ranges are sliced out below, so keep every line
+        lines = list(_read_lines(filepath))
+        # Index of the first line after the current session's header
+        session_start = 0
+
+        for index, line in enumerate(lines):
+            # Guiding frame data (CSV format), the bulk of the log; picked
+            # out of the session's line range in one go when it ends
+            if line[:1].isdigit():
+                continue
+
+            # One prefix check rejects the remaining non-header lines
+            line = line.strip()
+            if not line.startswith(_PHD2_HEADER_PREFIXES):
+                continue
 
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-
-                # Parse log start date
-                if line.startswith("PHD2 version"):
-                    match = re.search(r'Log enabled at (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                    if match:
-                        self.log_date = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
-
-                # Guiding session start
-                elif line.startswith("Guiding Begins at"):
-                    match = re.search(r'Guiding Begins at (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                    if match:
-                        current_session = GuidingSession(
-                            start_time=datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
-                        )
-
-                # Equipment profile
-                elif line.startswith("Equipment Profile") and current_session:
-                    match = re.search(r'Equipment Profile = (.+)', line)
-                    if match:
-                        current_session.equipment_profile = match.group(1)
-
-                # Pixel scale and focal length
-                elif line.startswith("Pixel scale") and current_session:
-                    match = re.search(r'Pixel scale = ([\d.]+).*Focal length = (\d+)', line)
-                    if match:
-                        current_session.pixel_scale = float(match.group(1))
-                        current_session.focal_length = int(match.group(2))
-
-                # RA, Dec, Hour angle, Pier side
-                elif line.startswith("RA =") and current_session:
-                    match = re.search(
-                        r'RA = ([\d.]+) hr, Dec = ([-\d.]+) deg, Hour angle = ([-\d.]+) hr, '
-                        r'Pier side = (\w+).*Alt = ([\d.]+) deg, Az = ([\d.]+) deg',
-                        line
+            # Parse log start date
+            if line.startswith("PHD2 version"):
+                match = _PHD2_LOG_ENABLED_RE.search(line)
+                if match:
+                    self.log_date = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
+
+            # Guiding session start
+            elif line.startswith("Guiding Begins at"):
+                match = _PHD2_GUIDING_BEGINS_RE.search(line)
+                if match:
+                    current_session = GuidingSession(
+                        start_time=datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
                     )
-                    if match:
-                        current_session.ra = float(match.group(1))
-                        current_session.dec = float(match.group(2))
-                        current_session.hour_angle = float(match.group(3))
-                        current_session.pier_side = match.group(4)
-                        current_session.altitude = float(match.group(5))
-                        current_session.azimuth = float(match.group(6))
-
-                # Guiding frame data (CSV format)
-                elif current_session and re.match(r'^\d+,', line):
-                    frame = self._parse_frame(line)
-                    if frame:
-                        current_session.frames.append(frame)
-
-                # Guiding session end
-                elif line.startswith("Guiding Ends at"):
-                    match = re.search(r'Guiding Ends at (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                    if match and current_session:
-                        current_session.end_time = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
-                        self.sessions.append(current_session)
-                        current_session = None
+                    session_start = index + 1
+
+            # Equipment profile
+            elif line.startswith("Equipment Profile") and current_session:
+                match = _PHD2_PROFILE_RE.search(line)
+                if match:
+                    current_session.equipment_profile = match.group(1)
+
+            # Pixel scale and focal length
+            elif line.startswith("Pixel scale") and current_session:
+                match = _PHD2_PIXEL_SCALE_RE.search(line)
+                if match:
+                    current_session.pixel_scale = float(match.group(1))
+                    current_session.focal_length = int(match.group(2))
+
+            # RA, Dec, Hour angle, Pier side
+            elif line.startswith("RA =") and current_session:
+                match = _PHD2_MOUNT_RE.search(line)
+                if match:
+                    current_session.ra = float(match.group(1))
+                    current_session.dec = float(match.group(2))
+                    current_session.hour_angle = float(match.group(3))
+                    current_session.pier_side = match.group(4)
+                    current_session.altitude = float(match.group(5))
+                    current_session.azimuth = float(match.group(6))
+
+            # Guiding session end
+            elif line.startswith("Guiding Ends at"):
+                match = _PHD2_GUIDING_ENDS_RE.search(line)
+                if match and current_session:
+                    current_session.end_time = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
+                    (current_session.frame_time, current_session.ra_raw,
+                     current_session.dec_raw, current_session.snr) = self._parse_frames(
+                        lines[session_start:index]
+                    )
+                    self.sessions.append(current_session)
+                    current_session = None
 
         return self.sessions
 
-    def _parse_frame(self, line: str) -> Optional[GuidingFrame]:
-        """Parse a single guiding frame line."""
-        parts = line.split(',')
-        if len(parts) < 18:
-            return None
+    @staticmethod
+    def _parse_frames(lines: list[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Convert a session's guiding frame lines to (time, ra_raw, dec_raw, snr) columns.
+
+        Lines that are not frame lines, have too few fields, an empty
+        required field or a value that is not a number are skipped.
+        """
+        # Frame lines are not stripped: only trailing whitespace is
+        # possible and it just ends up in the last, unused field
+        frame_lines = [line for line in lines if _PHD2_FRAME_RE.match(line)]
+        if not frame_lines:
+            empty = np.empty(0)
+            return empty, empty, empty, empty
 
         try:
-            return GuidingFrame(
-                frame=int(parts[0]),
-                time=float(parts[1]),
-                dx=float(parts[3]),
-                dy=float(parts[4]),
-                ra_raw=float(parts[5]),
-                dec_raw=float(parts[6]),
-                ra_guide=float(parts[7]),
-                dec_guide=float(parts[8]),
-                ra_duration=int(parts[9]) if parts[9] else 0,
-                dec_duration=int(parts[11]) if parts[11] else 0,
-                ra_direction=parts[10] if parts[10] else "",
-                dec_direction=parts[12] if parts[12] else "",
-                star_mass=float(parts[15]) if parts[15] else 0.0,
-                snr=float(parts[16]) if parts[16] else 0.0,
-                error_code=int(parts[17]) if parts[17] else 0,
+            # Fast path, one C-level pass; the error code field is read
+            # too so that short lines are rejected
+            values = np.loadtxt(
+                frame_lines, delimiter=',', usecols=_PHD2_FRAME_COLUMNS + (17,),
+                comments=None, ndmin=2
             )
-        except (ValueError, IndexError):
-            return None
+        except ValueError:
+            # Short lines, an empty SNR or a value that is not a number
+            values = PHD2Parser._parse_frame_fields(frame_lines)
+        return values[:, 0], values[:, 1], values[:, 2], values[:, 3]
+
+    @staticmethod
+    def _parse_frame_fields(frame_lines: list[str]) -> np.ndarray:
+        """Convert frame lines to rows of stored fields, skipping bad lines."""
+        rows = [parts for parts in (line.split(',') for line in frame_lines) if len(parts) >= 18]
+        # An empty SNR counts as zero
+        fields = [(parts[1], parts[5], parts[6], parts[16] or '0') for parts in rows]
+        try:
+            values = np.array(fields, dtype=np.float64)
+        except ValueError:
+            # Some value is not a number, drop the offending lines
+            fields = [row for row in fields if all(map(_is_number, row))]
+            values = np.array(fields, dtype=np.float64)
+        return values.reshape(-1, 4)
 
     def get_rms_over_time(
         self,
@@ -259,6 +395,10 @@ class PHD2Parser:
     ) -> list[tuple[datetime, float, float, float]]:
         """Calculate RMS values over time intervals across all sessions.
 
+        A bucket starts at the session start and collects frames until one
+        is at least interval_seconds past the bucket start; that frame
+        starts the next bucket.
+
         Args:
             interval_seconds: Time interval for RMS buckets.
             dither_events: List of DitherEvent objects to exclude from calculations.
@@ -267,66 +407,74 @@ class PHD2Parser:
         Returns list of (timestamp, ra_rms, dec_rms, total_rms) in arcseconds.
         """
         results = []
+        # At least 1 ns, so every bucket advances past its first frame
+        interval_ns = max(round(interval_seconds * 1e9), 1)
+        if dither_events:
+            dither_masks = self._dither_masks(dither_events, dither_margin_seconds)
 
-        for session in self.sessions:
-            if not session.frames:
+        for index, session in enumerate(self.sessions):
+            if not session.frame_count:
                 continue
 
             pixel_scale = session.pixel_scale or 1.0
-            current_bucket: list[GuidingFrame] = []
-            bucket_start = session.start_time
+            frame_time = session.frame_time
+            ra_raw = session.ra_raw
+            dec_raw = session.dec_raw
+            times_ns = session.frame_timestamps_ns
+
+            # Drop frames during a dither event (with margin)
+            if dither_events:
+                keep = ~dither_masks[index]
+                frame_time, ra_raw, dec_raw, times_ns = (
+                    frame_time[keep], ra_raw[keep], dec_raw[keep], times_ns[keep]
+                )
+            count = len(times_ns)
+            if not count:
+                continue
 
-            for frame in session.frames:
-                frame_time = session.start_time.timestamp() + frame.time
-                frame_dt = datetime.fromtimestamp(frame_time)
-
-                # Check if frame is during a dither event (with margin)
-                if dither_events and self._is_during_dither(frame_dt, dither_events, dither_margin_seconds):
-                    continue  # Skip this frame
-
-                if (frame_dt - bucket_start).total_seconds() >= interval_seconds:
-                    if current_bucket:
-                        ra_vals = [f.ra_raw for f in current_bucket]
-                        dec_vals = [f.dec_raw for f in current_bucket]
-                        # Convert from pixels to arcseconds
-                        ra_rms = float(np.sqrt(np.mean(np.square(ra_vals)))) * pixel_scale
-                        dec_rms = float(np.sqrt(np.mean(np.square(dec_vals)))) * pixel_scale
-                        total_rms = float(np.sqrt(ra_rms**2 + dec_rms**2))
-                        results.append((bucket_start, ra_rms, dec_rms, total_rms))
-
-                    bucket_start = frame_dt
-                    current_bucket = [frame]
-                else:
-                    current_bucket.append(frame)
-
-            # Don't forget the last bucket
-            if current_bucket:
-                ra_vals = [f.ra_raw for f in current_bucket]
-                dec_vals = [f.dec_raw for f in current_bucket]
-                # Convert from pixels to arcseconds
-                ra_rms = float(np.sqrt(np.mean(np.square(ra_vals)))) * pixel_scale
-                dec_rms = float(np.sqrt(np.mean(np.square(dec_vals)))) * pixel_scale
-                total_rms = float(np.sqrt(ra_rms**2 + dec_rms**2))
-                results.append((bucket_start, ra_rms, dec_rms, total_rms))
+            # Find the first frame of each bucket, one search per bucket
+            session_start_ts = session.start_time.timestamp()
+            edges: list[int] = []
+            labels: list[datetime] = []
+            bucket_start = session.start_time
+            bucket_start_ns = _timestamp_ns(session.start_time)
+            i = 0
+            while True:
+                j = int(np.searchsorted(times_ns, bucket_start_ns + interval_ns))
+                if j > i:
+                    edges.append(i)
+                    labels.append(bucket_start)
+                if j == count:
+                    break
+                bucket_start = datetime.fromtimestamp(session_start_ts + float(frame_time[j]))
+                bucket_start_ns = times_ns[j]
+                i = j
+
+            # Per-bucket mean squares, converted from pixels to arcseconds
+            sizes = np.diff(edges + [count])
+            ra_rms = np.sqrt(np.add.reduceat(np.square(ra_raw), edges) / sizes) * pixel_scale
+            dec_rms = np.sqrt(np.add.reduceat(np.square(dec_raw), edges) / sizes) * pixel_scale
+            total_rms = np.sqrt(ra_rms**2 + dec_rms**2)
+            results.extend(zip(labels, ra_rms.tolist(), dec_rms.tolist(), total_rms.tolist()))
 
         return results
 
-    def _is_during_dither(
-        self,
-        timestamp: datetime,
-        dither_events: list,
-        margin_seconds: float
-    ) -> bool:
-        """Check if a timestamp falls within a dither event (with margin)."""
-        from datetime import timedelta
-        margin = timedelta(seconds=margin_seconds)
-
-        for dither in dither_events:
-            start = dither.start_time - margin
-            end = (dither.end_time or dither.start_time) + margin
-            if start <= timestamp <= end:
-                return True
-        return False
+    def _dither_masks(self, dither_events: list, margin_seconds: float) -> list[np.ndarray]:
+        """Get a mask per session of the frames within a dither event (with margin).
+
+        The masks for the last dither list and margin are cached, so the
+        RMS calculations and exposure correlation share one build.
+        """
+        key = (len(dither_events), margin_seconds)
+        cached = self._dither_mask_cache
+        if cached is not None and cached[0] is dither_events and cached[1] == key:
+            return cached[2]
+        masks = [
+            _dither_mask(session.frame_timestamps_ns, dither_events, margin_seconds)
+            for session in self.sessions
+        ]
+        self._dither_mask_cache = (dither_events, key, masks)
+        return masks
 
     def get_overall_rms(
         self,
@@ -340,29 +488,31 @@ class PHD2Parser:
         all_ra = []
         all_dec = []
         pixel_scale = 1.0
+        if dither_events:
+            dither_masks = self._dither_masks(dither_events, dither_margin_seconds)
 
-        for session in self.sessions:
+        for index, session in enumerate(self.sessions):
             # Use the pixel scale from the first session that has one
             if session.pixel_scale:
                 pixel_scale = session.pixel_scale
 
-            for frame in session.frames:
-                frame_time = session.start_time.timestamp() + frame.time
-                frame_dt = datetime.fromtimestamp(frame_time)
-
-                # Skip frames during dither
-                if dither_events and self._is_during_dither(frame_dt, dither_events, dither_margin_seconds):
-                    continue
-
-                all_ra.append(frame.ra_raw)
-                all_dec.append(frame.dec_raw)
-
-        if not all_ra:
+            ra_raw = session.ra_raw
+            dec_raw = session.dec_raw
+            # Skip frames during dither
+            if dither_events:
+                keep = ~dither_masks[index]
+                ra_raw, dec_raw = ra_raw[keep], dec_raw[keep]
+            all_ra.append(ra_raw)
+            all_dec.append(dec_raw)
+
+        ra_values = np.concatenate(all_ra) if all_ra else np.empty(0)
+        dec_values = np.concatenate(all_dec) if all_dec else np.empty(0)
+        if not len(ra_values):
             return (0.0, 0.0, 0.0)
 
         # Convert from pixels to arcseconds
-        ra_rms = float(np.sqrt(np.mean(np.square(all_ra)))) * pixel_scale
-        dec_rms = float(np.sqrt(np.mean(np.square(all_dec)))) * pixel_scale
+        ra_rms = float(np.sqrt(np.mean(np.square(ra_values)))) * pixel_scale
+        dec_rms = float(np.sqrt(np.mean(np.square(dec_values)))) * pixel_scale
         total_rms = float(np.sqrt(ra_rms**2 + dec_rms**2))
 
         return (ra_rms, dec_rms, total_rms)
@@ -371,7 +521,14 @@ class PHD2Parser:
 class NINAParser:
     """Parser for NINA log files."""
 
+    # Default amount of data read from the end of the file by parse_tail()
+    TAIL_BYTES = 4_000_000
+
     def __init__(self):
+        self._reset()
+
+    def _reset(self) -> None:
+        """Clear all parsed data and parser state."""
         self.autofocus_runs: list[AutofocusRun] = []
         self.exposures: list[Exposure] = []
         self.filter_changes: list[FilterChange] = []
@@ -397,24 +554,60 @@ class NINAParser:
         self.meridian_flips = []
         self.rms_alerts = []
 
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                self._parse_line(line)
+        for line in _read_lines(filepath):
+            line = line.strip()
+            self._parse_line(line)
+
+    def parse_tail(self, filepath: str | Path, max_bytes: int = TAIL_BYTES) -> None:
+        """Parse only the end of a NINA log file.
+
+        Reads the last max_bytes of the file, which is enough to cover the
+        most recent target of a long log. Falls back to a full parse if no
+        target starts within that window.
+        """
+        self._reset()
+        if os.path.getsize(filepath) <= max_bytes:
+            self.parse(filepath)
+            return
+
+        for line in _read_lines(filepath, max_bytes):
+            line = line.strip()
+            self._parse_line(line)
+
+        if not self.target_name:
+            self._reset()
+            self.parse(filepath)
 
     def _parse_timestamp(self, line: str) -> Optional[datetime]:
-        """Extract timestamp from NINA log line."""
-        match = re.match(r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+)', line)
-        if match:
-            ts_str = match.group(1)[:23]  # Truncate to milliseconds
-            try:
-                return datetime.strptime(ts_str, "%Y-%m-%dT%H:%M:%S.%f")
-            except ValueError:
-                return datetime.strptime(ts_str[:19], "%Y-%m-%dT%H:%M:%S")
-        return None
+        """Extract timestamp from NINA log line.
+
+        Lines start with a fixed-layout 'YYYY-MM-DDTHH:MM:SS.fff' stamp,
+        so the fields are taken by position.
+        """
+        if not (
+            len(line) >= 21 and line[4] == '-' and line[7] == '-' and line[10] == 'T'
+            and line[13] == ':' and line[16] == ':' and line[19] == '.'
+        ):
+            return None
+        # Truncate the fraction to milliseconds
+        digits = 0
+        while digits < 3 and line[20 + digits:21 + digits].isdigit():
+            digits += 1
+        if not digits:
+            return None
+        try:
+            # Many lines share the same second, only the fraction differs
+            timestamp = _parse_nina_seconds(line[:19])
+        except ValueError:
+            return None
+        return timestamp.replace(microsecond=int(line[20:20 + digits].ljust(6, '0')))
 
     def _parse_line(self, line: str) -> None:
         """Parse a single log line."""
+        # Every log entry starts with its timestamp; skip continuation lines
+        if not line or not line[0].isdigit():
+            return
+
         timestamp = self._parse_timestamp(line)
         if not timestamp:
             return
@@ -423,39 +616,50 @@ class NINAParser:
             self.session_start = timestamp
         self.session_end = timestamp
 
-        # Target name from DeepSkyObjectContainer
-        if "DeepSkyObjectContainer" in line and "Target:" in line:
-            match = re.search(r'Target:\s*(.+?)\s+RA:', line)
+        # Only run the handlers whose marker substring is in the line
+        for marker, handler in self._LINE_HANDLERS:
+            if marker in line:
+                handler(self, line, timestamp)
+
+    def _handle_target(self, line: str, timestamp: datetime) -> None:
+        """Target name from DeepSkyObjectContainer."""
+        if "Target:" in line:
+            match = _NINA_TARGET_RE.search(line)
             if match:
                 self.target_name = match.group(1).strip()
 
-        # Autofocus start
-        if "RunAutofocus" in line and "Starting" in line:
+    def _handle_autofocus_start(self, line: str, timestamp: datetime) -> None:
+        """Autofocus start."""
+        if "Starting" in line:
             self._pending_af = AutofocusRun(
                 timestamp=timestamp,
                 filter_name=self._current_filter
             )
 
-        # Autofocus initial position
-        if "Starting AutoFocus with initial position" in line and self._pending_af:
-            match = re.search(r'initial position (\d+)', line)
+    def _handle_autofocus_initial(self, line: str, timestamp: datetime) -> None:
+        """Autofocus initial position."""
+        if self._pending_af:
+            match = _NINA_AF_INITIAL_RE.search(line)
             if match:
                 self._pending_af.initial_position = int(match.group(1))
 
-        # Autofocus trigger reason
-        if "AutofocusAfter" in line and "Starting Trigger" in line:
-            match = re.search(r'Trigger: (AutofocusAfter\w+)', line)
+    def _handle_autofocus_trigger(self, line: str, timestamp: datetime) -> None:
+        """Autofocus trigger reason."""
+        if "Starting Trigger" in line:
+            match = _NINA_AF_TRIGGER_RE.search(line)
             if match and self._pending_af:
                 self._pending_af.trigger = match.group(1)
 
-        # Autofocus completion
-        if "BroadcastSuccessfulAutoFocusRun" in line:
-            match = re.search(r'Temperature ([\d.]+)', line)
-            if match and self._pending_af:
-                self._pending_af.temperature = float(match.group(1))
+    def _handle_autofocus_success(self, line: str, timestamp: datetime) -> None:
+        """Autofocus completion temperature."""
+        match = _NINA_AF_TEMPERATURE_RE.search(line)
+        if match and self._pending_af:
+            self._pending_af.temperature = float(match.group(1))
 
-        if "AutoFocus completed" in line and self._pending_af:
-            match = re.search(r'ending at (\d+)', line)
+    def _handle_autofocus_completed(self, line: str, timestamp: datetime) -> None:
+        """Autofocus final position."""
+        if self._pending_af:
+            match = _NINA_AF_FINAL_RE.search(line)
             if match:
                 self._pending_af.final_position = int(match.group(1))
                 if self._last_hfr:
@@ -463,16 +667,18 @@ class NINAParser:
                 self.autofocus_runs.append(self._pending_af)
                 self._pending_af = None
 
-        # HFR detection (Hocus Focus)
-        if "HocusFocusStarDetection" in line and "Average HFR:" in line:
-            match = re.search(r'Average HFR: ([\d.]+).*Detected Stars (\d+)', line)
+    def _handle_star_detection(self, line: str, timestamp: datetime) -> None:
+        """HFR detection (Hocus Focus)."""
+        if "Average HFR:" in line:
+            match = _NINA_HFR_RE.search(line)
             if match:
                 self._last_hfr = float(match.group(1))
                 self._last_stars = int(match.group(2))
 
-        # Filter change
-        if "FilterWheelVM" in line and "Moving to Filter" in line:
-            match = re.search(r'Moving to Filter (\w+) at Position (\d+)', line)
+    def _handle_filter_wheel(self, line: str, timestamp: datetime) -> None:
+        """Filter change."""
+        if "Moving to Filter" in line:
+            match = _NINA_FILTER_RE.search(line)
             if match:
                 new_filter = match.group(1)
                 position = int(match.group(2))
@@ -483,12 +689,10 @@ class NINAParser:
                 ))
                 self._current_filter = new_filter
 
-        # Exposure start
-        if "CameraVM" in line and "Starting Exposure" in line:
-            match = re.search(
-                r'Exposure Time: ([\d.]+)s; Filter: (\w*); Gain: (\d+); Offset (\d+); Binning: (\d+x\d+)',
-                line
-            )
+    def _handle_camera(self, line: str, timestamp: datetime) -> None:
+        """Exposure start."""
+        if "Starting Exposure" in line:
+            match = _NINA_EXPOSURE_RE.search(line)
             if match:
                 filter_name = match.group(2) if match.group(2) else self._current_filter
                 # Update current filter if captured from exposure
@@ -503,9 +707,10 @@ class NINAParser:
                     binning=match.group(5)
                 )
 
-        # Saved LIGHT image
-        if "SaveToDisk" in line and "LIGHT" in line:
-            match = re.search(r'Saved image to (.+\.fits)', line)
+    def _handle_save_to_disk(self, line: str, timestamp: datetime) -> None:
+        """Saved LIGHT image."""
+        if "LIGHT" in line:
+            match = _NINA_SAVED_RE.search(line)
             if match and self._pending_exposure:
                 self._pending_exposure.saved_path = match.group(1)
                 if self._last_hfr:
@@ -515,9 +720,10 @@ class NINAParser:
                 self.exposures.append(self._pending_exposure)
                 self._pending_exposure = None
 
-        # Pier side detection
-        if "MeridianFlipTrigger" in line and "pier side" in line:
-            match = re.search(r'pier side pier(\w+)', line)
+    def _handle_meridian_flip(self, line: str, timestamp: datetime) -> None:
+        """Pier side detection."""
+        if "pier side" in line:
+            match = _NINA_PIER_SIDE_RE.search(line)
             if match:
                 new_pier_side = match.group(1)
                 if self._current_pier_side and self._current_pier_side != new_pier_side:
@@ -528,9 +734,10 @@ class NINAParser:
                     ))
                 self._current_pier_side = new_pier_side
 
-        # RMS threshold alert
-        if "InterruptWhenRMSAbove" in line and "Total RMS above threshold" in line:
-            match = re.search(r'Total RMS above threshold \(([\d.]+) / ([\d.]+)\)', line)
+    def _handle_rms_alert(self, line: str, timestamp: datetime) -> None:
+        """RMS threshold alert."""
+        if "Total RMS above threshold" in line:
+            match = _NINA_RMS_ALERT_RE.search(line)
             if match:
                 alert = RMSAlert(
                     timestamp=timestamp,
@@ -541,16 +748,33 @@ class NINAParser:
                 )
                 self.rms_alerts.append(alert)
 
-        # Dither start
-        if "SequenceItem" in line and "Starting" in line and "Item: Dither" in line:
+    def _handle_sequence_item(self, line: str, timestamp: datetime) -> None:
+        """Dither start and end."""
+        if "Item: Dither" not in line:
+            return
+        if "Starting" in line:
             self._pending_dither = DitherEvent(start_time=timestamp)
-
-        # Dither end
-        if "SequenceItem" in line and "Finishing" in line and "Item: Dither" in line:
-            if self._pending_dither:
-                self._pending_dither.end_time = timestamp
-                self.dither_events.append(self._pending_dither)
-                self._pending_dither = None
+        if "Finishing" in line and self._pending_dither:
+            self._pending_dither.end_time = timestamp
+            self.dither_events.append(self._pending_dither)
+            self._pending_dither = None
+
+    # (marker substring, handler) in the order the rules are applied
+    _LINE_HANDLERS = (
+        ("DeepSkyObjectContainer", _handle_target),
+        ("RunAutofocus", _handle_autofocus_start),
+        ("Starting AutoFocus with initial position", _handle_autofocus_initial),
+        ("AutofocusAfter", _handle_autofocus_trigger),
+        ("BroadcastSuccessfulAutoFocusRun", _handle_autofocus_success),
+        ("AutoFocus completed", _handle_autofocus_completed),
+        ("HocusFocusStarDetection", _handle_star_detection),
+        ("FilterWheelVM", _handle_filter_wheel),
+        ("CameraVM", _handle_camera),
+        ("SaveToDisk", _handle_save_to_disk),
+        ("MeridianFlipTrigger", _handle_meridian_flip),
+        ("InterruptWhenRMSAbove", _handle_rms_alert),
+        ("SequenceItem", _handle_sequence_item),
+    )
 
     def get_hfr_over_time(self) -> list[tuple[datetime, float, str]]:
         """Get HFR values over time from saved exposures.
@@ -575,21 +799,28 @@ def match_session_logs(phd2_path: str | Path, nina_path: str | Path) -> tuple[PH
     return phd2_parser, nina_parser
 
 
+class ScanCancelled(Exception):
+    """Raised when a SessionFinder scan is cancelled."""
+
+
 @dataclass
 class DiscoveredSession:
     """A discovered session with matching log files."""
     session_date: date
-    nina_logs: list[Path] = field(default_factory=list)
-    phd2_logs: list[Path] = field(default_factory=list)
+    nina_logs: list[Path] = field(default_factory=list)  # Sorted by SessionFinder
+    phd2_logs: list[Path] = field(default_factory=list)  # Sorted by SessionFinder
 
     @property
     def has_both(self) -> bool:
         """Check if session has both NINA and PHD2 logs."""
         return bool(self.nina_logs and self.phd2_logs)
 
-    @property
+    @functools.cached_property
     def display_name(self) -> str:
-        """Get display name for session."""
+        """Get display name for session.
+
+        Computed on first access, once the scan has filled in the logs.
+        """
         nina_count = len(self.nina_logs)
         phd2_count = len(self.phd2_logs)
         return f"{self.session_date.strftime('%Y-%m-%d')} ({nina_count} NINA, {phd2_count} PHD2)"
@@ -599,8 +830,13 @@ class SessionFinder:
     """Finds and matches NINA and PHD2 log files by date."""
 
     # Regex patterns for extracting dates from filenames
-    NINA_PATTERN = re.compile(r'^(\d{4})(\d{2})(\d{2})-\d{6}.*\.log$')
-    PHD2_PATTERN = re.compile(r'^PHD2_GuideLog_(\d{4})-(\d{2})-(\d{2})_\d{6}\.txt$')
+    NINA_PATTERN = re.compile(r'^(\d{8})-\d{6}.*\.log$')
+    PHD2_PATTERN = re.compile(r'^PHD2_GuideLog_(\d{4}-\d{2}-\d{2})_\d{6}\.txt$')
+
+    # Recent scan results by folder key, shared by all finders (LRU order)
+    SCAN_CACHE_SIZE = 8
+    _scan_cache: OrderedDict[tuple, tuple[DiscoveredSession, ...]] = OrderedDict()
+    _scan_cache_lock = threading.Lock()
 
     def __init__(self, nina_folder: Optional[Path] = None, phd2_folder: Optional[Path] = None):
         self.nina_folder = Path(nina_folder) if nina_folder else None
@@ -615,53 +851,132 @@ class SessionFinder:
         """Set the PHD2 logs folder."""
         self.phd2_folder = Path(folder)
 
-    def scan(self) -> list[DiscoveredSession]:
-        """Scan folders and find matching sessions."""
+    def _folder_key(self) -> tuple:
+        """Get the folders and their modification times.
+
+        A folder's mtime changes whenever a file is added, removed or
+        renamed in it, so an unchanged key means an unchanged scan.
+        """
+        key = []
+        for folder in (self.nina_folder, self.phd2_folder):
+            try:
+                mtime = folder.stat().st_mtime_ns if folder else None
+            except OSError:
+                mtime = None
+            key.append((folder, mtime))
+        return tuple(key)
+
+    def scan(self, cancel_event: Optional[threading.Event] = None) -> list[DiscoveredSession]:
+        """Scan folders and find matching sessions.
+
+        Results are cached across finders and reused while neither folder
+        has changed. Setting cancel_event from another thread stops the
+        scan with ScanCancelled.
+        """
+        key = self._folder_key()
+        with self._scan_cache_lock:
+            cached = self._scan_cache.get(key)
+            if cached is not None:
+                self._scan_cache.move_to_end(key)
+                return list(cached)
+
         self._sessions = {}
 
-        # Scan NINA logs
-        if self.nina_folder and self.nina_folder.exists():
-            for log_file in self.nina_folder.glob('*.log'):
-                session_date = self._extract_nina_date(log_file.name)
-                if session_date:
-                    if session_date not in self._sessions:
-                        self._sessions[session_date] = DiscoveredSession(session_date=session_date)
-                    self._sessions[session_date].nina_logs.append(log_file)
-
-        # Scan PHD2 logs
-        if self.phd2_folder and self.phd2_folder.exists():
-            for log_file in self.phd2_folder.glob('PHD2_GuideLog_*.txt'):
-                session_date = self._extract_phd2_date(log_file.name)
-                if session_date:
-                    if session_date not in self._sessions:
-                        self._sessions[session_date] = DiscoveredSession(session_date=session_date)
-                    self._sessions[session_date].phd2_logs.append(log_file)
+        if self.nina_folder and self.phd2_folder:
+            # Scan both folders concurrently; the work is mostly waiting on I/O
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                nina_future = executor.submit(self._scan_nina_folder, cancel_event)
+                phd2_future = executor.submit(self._scan_phd2_folder, cancel_event)
+                nina_logs = nina_future.result()
+                phd2_logs = phd2_future.result()
+        else:
+            nina_logs = self._scan_nina_folder(cancel_event)
+            phd2_logs = self._scan_phd2_folder(cancel_event)
+
+        for session_date, path in nina_logs:
+            self._session_for(session_date).nina_logs.append(path)
+        for session_date, path in phd2_logs:
+            self._session_for(session_date).phd2_logs.append(path)
+        # Sort the logs once here so the selector can list them as they are
+        for session in self._sessions.values():
+            session.nina_logs.sort()
+            session.phd2_logs.sort()
 
         # Sort by date descending (newest first)
-        return sorted(self._sessions.values(), key=lambda s: s.session_date, reverse=True)
+        result = sorted(self._sessions.values(), key=lambda s: s.session_date, reverse=True)
+        with self._scan_cache_lock:
+            self._scan_cache[key] = tuple(result)
+            while len(self._scan_cache) > self.SCAN_CACHE_SIZE:
+                self._scan_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _open_folder(folder: Optional[Path]):
+        """Open a scandir iterator, or return None if the folder is unset or missing."""
+        if not folder:
+            return None
+        # Let scandir report a missing folder rather than checking first
+        try:
+            return os.scandir(folder)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
 
-    def get_matching_sessions(self) -> list[DiscoveredSession]:
+    def _scan_nina_folder(self, cancel_event: Optional[threading.Event]) -> list[tuple[date, Path]]:
+        """Find the NINA logs and their session dates."""
+        found = []
+        entries = self._open_folder(self.nina_folder)
+        if entries is None:
+            return found
+        with entries:
+            for entry in entries:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ScanCancelled()
+                if not entry.name.endswith('.log'):
+                    continue
+                session_date = self._extract_date(self.NINA_PATTERN, entry.name)
+                # Name checks first; is_file() uses the type scandir
+                # already read, so it rarely needs a stat
+                if session_date and entry.is_file():
+                    found.append((session_date, Path(entry.path)))
+        return found
+
+    def _scan_phd2_folder(self, cancel_event: Optional[threading.Event]) -> list[tuple[date, Path]]:
+        """Find the PHD2 guide logs and their session dates."""
+        found = []
+        entries = self._open_folder(self.phd2_folder)
+        if entries is None:
+            return found
+        with entries:
+            for entry in entries:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ScanCancelled()
+                if not (entry.name.startswith('PHD2_GuideLog_') and entry.name.endswith('.txt')):
+                    continue
+                session_date = self._extract_date(self.PHD2_PATTERN, entry.name)
+                if session_date and entry.is_file():
+                    found.append((session_date, Path(entry.path)))
+        return found
+
+    def _session_for(self, session_date: date) -> DiscoveredSession:
+        """Get the session for a date, creating it on first use."""
+        session = self._sessions.get(session_date)
+        if session is None:
+            session = self._sessions[session_date] = DiscoveredSession(session_date=session_date)
+        return session
+
+    def get_matching_sessions(self, cancel_event: Optional[threading.Event] = None) -> list[DiscoveredSession]:
         """Get only sessions that have both NINA and PHD2 logs."""
-        return [s for s in self.scan() if s.has_both]
-
-    def _extract_nina_date(self, filename: str) -> Optional[date]:
-        """Extract date from NINA log filename."""
-        match = self.NINA_PATTERN.match(filename)
-        if match:
-            year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
-            try:
-                return date(year, month, day)
-            except ValueError:
-                return None
-        return None
+        return [s for s in self.scan(cancel_event) if s.has_both]
 
-    def _extract_phd2_date(self, filename: str) -> Optional[date]:
-        """Extract date from PHD2 log filename."""
-        match = self.PHD2_PATTERN.match(filename)
+    @staticmethod
+    def _extract_date(pattern: re.Pattern, filename: str) -> Optional[date]:
+        """Extract the date from a log filename matching a compiled pattern."""
+        match = pattern.match(filename)
         if match:
-            year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
+            # The pattern has validated the digits; PHD2 names use dashes
+            stamp = match.group(1).replace('-', '')
             try:
-                return date(year, month, day)
+                return date(int(stamp[:4]), int(stamp[4:6]), int(stamp[6:8]))
             except ValueError:
                 return None
         return None
@@ -684,8 +999,6 @@ def correlate_guiding_with_exposures(
         dither_events: Optional list of dither events to exclude
         dither_margin_seconds: Margin around dither events to exclude
     """
-    from datetime import timedelta
-
     # Get pixel scale from PHD2 sessions (use first session that has one)
     pixel_scale = 1.0
     for session in phd2.sessions:
@@ -693,44 +1006,43 @@ def correlate_guiding_with_exposures(
             pixel_scale = session.pixel_scale
             break
 
+    if not phd2.sessions:
+        # Drop values from an earlier correlation
+        for exposure in nina.exposures:
+            exposure.ra_rms = exposure.dec_rms = exposure.total_rms = None
+            exposure.guiding_frames = 0
+        return
+
+    # All guiding frames in time order, with absolute times in nanoseconds
+    times_ns = np.concatenate([session.frame_timestamps_ns for session in phd2.sessions])
+    all_ra = np.concatenate([session.ra_raw for session in phd2.sessions])
+    all_dec = np.concatenate([session.dec_raw for session in phd2.sessions])
+
+    # Frames during dither are skipped
+    if dither_events:
+        keep = ~np.concatenate(phd2._dither_masks(dither_events, dither_margin_seconds))
+        times_ns, all_ra, all_dec = times_ns[keep], all_ra[keep], all_dec[keep]
+
+    order = np.argsort(times_ns, kind='stable')
+    times_ns, all_ra, all_dec = times_ns[order], all_ra[order], all_dec[order]
+
     for exposure in nina.exposures:
-        # Calculate exposure time window
+        # The parser may be reused with another PHD2 log or dither setting,
+        # so clear values from an earlier correlation
+        exposure.ra_rms = exposure.dec_rms = exposure.total_rms = None
+        exposure.guiding_frames = 0
+
+        # Guiding frames within the exposure time window (inclusive)
         exp_start = exposure.timestamp
         exp_end = exp_start + timedelta(seconds=exposure.exposure_time)
-
-        # Collect guiding frames during this exposure
-        ra_values = []
-        dec_values = []
-
-        for session in phd2.sessions:
-            for frame in session.frames:
-                # Calculate absolute time of this frame
-                frame_time = session.start_time.timestamp() + frame.time
-                frame_dt = datetime.fromtimestamp(frame_time)
-
-                # Check if frame is within exposure window
-                if exp_start <= frame_dt <= exp_end:
-                    # Check if frame is during dither (skip if so)
-                    if dither_events:
-                        is_dither = False
-                        margin = timedelta(seconds=dither_margin_seconds)
-                        for dither in dither_events:
-                            d_start = dither.start_time - margin
-                            d_end = (dither.end_time or dither.start_time) + margin
-                            if d_start <= frame_dt <= d_end:
-                                is_dither = True
-                                break
-                        if is_dither:
-                            continue
-
-                    ra_values.append(frame.ra_raw)
-                    dec_values.append(frame.dec_raw)
+        i0 = np.searchsorted(times_ns, _timestamp_ns(exp_start), side='left')
+        i1 = np.searchsorted(times_ns, _timestamp_ns(exp_end), side='right')
 
         # Calculate RMS for this exposure (in arcseconds)
-        if ra_values:
-            ra_rms_px = float(np.sqrt(np.mean(np.square(ra_values))))
-            dec_rms_px = float(np.sqrt(np.mean(np.square(dec_values))))
+        if i1 > i0:
+            ra_rms_px = float(np.sqrt(np.mean(np.square(all_ra[i0:i1]))))
+            dec_rms_px = float(np.sqrt(np.mean(np.square(all_dec[i0:i1]))))
             exposure.ra_rms = ra_rms_px * pixel_scale
             exposure.dec_rms = dec_rms_px * pixel_scale
             exposure.total_rms = float(np.sqrt(exposure.ra_rms**2 + exposure.dec_rms**2))
-            exposure.guiding_frames = len(ra_values)
+            exposure.guiding_frames = int(i1 - i0)
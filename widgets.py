@@ -1,23 +1,93 @@
 """
 Custom widgets for the Astro Session Viewer.
 """
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget,
-    QTableWidgetItem, QHeaderView, QGroupBox, QComboBox,
+    QTableWidgetItem, QTableView, QHeaderView, QStyledItemDelegate, QGroupBox, QComboBox,
     QSplitter, QFrame, QCheckBox, QSpinBox, QDoubleSpinBox,
     QDialog, QDialogButtonBox, QListWidget, QListWidgetItem,
     QPushButton, QFileDialog, QLineEdit, QFormLayout, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QTimer,
+    QObject, QRunnable, QThreadPool
+)
 from PyQt6.QtGui import QColor, QBrush
 from pathlib import Path
 import pyqtgraph as pg
 import numpy as np
 
-from parsers import PHD2Parser, NINAParser, GuidingSession
+from parsers import (
+    PHD2Parser, NINAParser, GuidingSession, Exposure, SessionFinder, ScanCancelled
+)
+
+
+# Shared brushes for table cells, built once instead of per row
+_BRUSH_RED = QBrush(QColor("#FFCDD2"))  # Light red
+_BRUSH_YELLOW = QBrush(QColor("#FFF9C4"))  # Light yellow
+_BRUSH_GREEN = QBrush(QColor("#C8E6C9"))  # Light green
+_BRUSH_GREY_FG = QBrush(QColor("#999"))  # Placeholder text
+
+# Event row backgrounds by event type
+_BRUSH_EVENT_AUTOFOCUS = QBrush(QColor("#E1BEE7"))
+_BRUSH_EVENT_FILTER = QBrush(QColor("#B3E5FC"))
+_BRUSH_EVENT_FLIP = QBrush(QColor("#FFE0B2"))
+_BRUSH_EVENT_ALERT = _BRUSH_RED
+_BRUSH_EVENT_DITHER = _BRUSH_YELLOW
+_BRUSH_EVENT_GUIDING_START = _BRUSH_GREEN
+_BRUSH_EVENT_GUIDING_END = QBrush(QColor("#FFCCBC"))
+
+# Event detail templates, parsed once and called as bound methods
+_FMT_AUTOFOCUS = "{0} - HFR: {1:.2f}".format
+_FMT_FILTER = "Changed to {0}".format
+_FMT_FLIP = "{0} -> {1}".format
+_FMT_RMS_ALERT = "Total: {0:.2f}\" (threshold: {1}\")".format
+_FMT_DITHER = "Duration: {0:.1f}s".format
+_FMT_GUIDING_START = "Pier: {0}, Alt: {1:.1f}°".format
+_FMT_GUIDING_END = "RMS: {0:.2f}\"".format
+
+
+def _fmt_hms(dt: datetime) -> str:
+    """Format the time of day as HH:MM:SS without going through strftime."""
+    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
+def _timestamps(datetimes: list[datetime]) -> np.ndarray:
+    """Convert datetimes to an array of Unix timestamps."""
+    return np.fromiter((dt.timestamp() for dt in datetimes), dtype=np.float64,
+                       count=len(datetimes))
+
+
+@contextmanager
+def _quiet_update(widget: QWidget):
+    """Suspend repaints and signals while a widget is filled."""
+    widget.setUpdatesEnabled(False)
+    was_blocked = widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        widget.blockSignals(was_blocked)
+        widget.setUpdatesEnabled(True)
+
+
+@contextmanager
+def _batched_update(table: QTableWidget):
+    """Suspend repaints, signals and column fitting while a table is filled."""
+    header = table.horizontalHeader()
+    resize_modes = [header.sectionResizeMode(i) for i in range(header.count())]
+    header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    try:
+        with _quiet_update(table):
+            yield
+    finally:
+        # Restoring the modes fits the columns once for the new contents
+        for section, mode in enumerate(resize_modes):
+            header.setSectionResizeMode(section, mode)
 
 
 class SessionSummaryWidget(QGroupBox):
@@ -27,6 +97,8 @@ class SessionSummaryWidget(QGroupBox):
         super().__init__("Session Summary", parent)
         self._phd2: Optional[PHD2Parser] = None
         self._nina: Optional[NINAParser] = None
+        # Overall RMS without dither exclusion for the current PHD2 data
+        self._raw_rms: Optional[tuple[float, float, float]] = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -67,10 +139,22 @@ class SessionSummaryWidget(QGroupBox):
 
     def update_data(self, phd2: Optional[PHD2Parser], nina: Optional[NINAParser],
                     dither_margin: float = 3.0, exclude_dither: bool = True):
-        """Update the summary with parsed data."""
-        self._phd2 = phd2
-        self._nina = nina
+        """Update the summary with parsed data.
+
+        Only the guiding RMS depends on the dither settings; the session
+        details and raw RMS are recomputed only when the parsers change.
+        """
+        if phd2 is not self._phd2 or nina is not self._nina:
+            self._phd2 = phd2
+            self._nina = nina
+            self._update_session_info(nina)
+            # Calculate RMS without dither exclusion (raw)
+            self._raw_rms = phd2.get_overall_rms(dither_events=None) if phd2 else None
+
+        self._update_guiding_rms(phd2, nina, dither_margin, exclude_dither)
 
+    def _update_session_info(self, nina: Optional[NINAParser]) -> None:
+        """Update the target, timing and integration labels."""
         if nina:
             self.target_label.setText(f"Target: {nina.target_name or 'Unknown'}")
             if nina.session_start:
@@ -88,11 +172,12 @@ class SessionSummaryWidget(QGroupBox):
             int_minutes, _ = divmod(int_remainder, 60)
             self.integration_label.setText(f"Integration: {int(int_hours)}h {int(int_minutes)}m")
 
+    def _update_guiding_rms(self, phd2: Optional[PHD2Parser], nina: Optional[NINAParser],
+                            dither_margin: float, exclude_dither: bool) -> None:
+        """Update the RMS labels for the given dither settings."""
         if phd2 and phd2.sessions:
             dither_events = nina.dither_events if nina else None
-
-            # Calculate RMS without dither exclusion (raw)
-            ra_raw, dec_raw, total_raw = phd2.get_overall_rms(dither_events=None)
+            ra_raw, dec_raw, total_raw = self._raw_rms
 
             # Calculate RMS with dither exclusion (filtered)
             if dither_events and exclude_dither:
@@ -131,6 +216,18 @@ class GuidingChartWidget(QWidget):
     # Signal emitted when dither settings change
     ditherSettingsChanged = pyqtSignal(float, bool)  # margin, exclude
 
+    # Plot pens and brushes, shared by every chart update
+    _PEN_RA = pg.mkPen(color='#2196F3', width=2)
+    _PEN_DEC = pg.mkPen(color='#4CAF50', width=2)
+    _PEN_TOTAL = pg.mkPen(color='#F44336', width=2)
+    _DITHER_BRUSH = pg.mkBrush(255, 193, 7, 50)  # Yellow with transparency
+    _DITHER_PEN = pg.mkPen(None)
+    _AUTOFOCUS_PEN = pg.mkPen('#9C27B0', width=1, style=Qt.PenStyle.DashLine)
+    _FLIP_PEN = pg.mkPen('#FF9800', width=2, style=Qt.PenStyle.DashLine)
+
+    # Delay after the last settings change before the chart is rebuilt
+    SETTINGS_DELAY_MS = 50
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui()
@@ -139,6 +236,13 @@ class GuidingChartWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
+        # Collapses a burst of control changes (e.g. spinbox scrolling)
+        # into a single chart update
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(self.SETTINGS_DELAY_MS)
+        self._settings_timer.timeout.connect(self._on_settings_changed)
+
         # Header with controls
         header = QHBoxLayout()
         header.addWidget(QLabel("<b>Guiding RMS</b>"))
@@ -149,7 +253,7 @@ class GuidingChartWidget(QWidget):
         self.granularity_combo = QComboBox()
         self.granularity_combo.addItems(["1 min", "5 min", "10 min", "30 min"])
         self.granularity_combo.setCurrentIndex(1)  # Default to 5 min
-        self.granularity_combo.currentIndexChanged.connect(self._on_settings_changed)
+        self.granularity_combo.currentIndexChanged.connect(self._schedule_settings_update)
         header.addWidget(self.granularity_combo)
 
         header.addSpacing(20)
@@ -158,7 +262,7 @@ class GuidingChartWidget(QWidget):
         self.exclude_dither_cb = QCheckBox("Exclude dither")
         self.exclude_dither_cb.setChecked(True)
         self.exclude_dither_cb.setToolTip("Exclude guiding data during dither settling")
-        self.exclude_dither_cb.stateChanged.connect(self._on_settings_changed)
+        self.exclude_dither_cb.stateChanged.connect(self._schedule_settings_update)
         header.addWidget(self.exclude_dither_cb)
 
         # Dither margin spinbox
@@ -169,7 +273,7 @@ class GuidingChartWidget(QWidget):
         self.dither_margin_spin.setSuffix(" s")
         self.dither_margin_spin.setSingleStep(0.5)
         self.dither_margin_spin.setToolTip("Seconds before/after dither to exclude")
-        self.dither_margin_spin.valueChanged.connect(self._on_settings_changed)
+        self.dither_margin_spin.valueChanged.connect(self._schedule_settings_update)
         header.addWidget(self.dither_margin_spin)
 
         layout.addLayout(header)
@@ -183,16 +287,30 @@ class GuidingChartWidget(QWidget):
         self.plot_widget.setLabel('bottom', 'Time')
         # Disable SI prefix auto-scaling on Y axis
         self.plot_widget.getAxis('left').enableAutoSIPrefix(False)
+        # Draw only the visible part of the curves, reduced to about one
+        # min/max pair per pixel, without antialiasing
+        self.plot_widget.setDownsampling(auto=True, mode='peak')
+        self.plot_widget.setClipToView(True)
+        self.plot_widget.setAntialiasing(False)
         self.plot_widget.addLegend()
 
         layout.addWidget(self.plot_widget)
 
         self._phd2_parser: Optional[PHD2Parser] = None
         self._nina_parser: Optional[NINAParser] = None
-        self._event_markers: list = []
+        # RMS series for the current parsers by (interval, dither exclusion, margin)
+        self._rms_cache: dict[tuple, Optional[np.ndarray]] = {}
+        # Current RMS curves, replaced on every update
+        self._curves: list[pg.PlotDataItem] = []
+        # Marker items stay in the plot and are moved or hidden on update
+        self._dither_regions: list[pg.LinearRegionItem] = []
+        self._af_lines: list[pg.InfiniteLine] = []
+        self._flip_lines: list[pg.InfiniteLine] = []
 
     def set_data(self, phd2: PHD2Parser, nina: Optional[NINAParser] = None):
         """Set the PHD2 data to display."""
+        if phd2 is not self._phd2_parser or nina is not self._nina_parser:
+            self._rms_cache = {}
         self._phd2_parser = phd2
         self._nina_parser = nina
         self._update_chart()
@@ -234,6 +352,10 @@ class GuidingChartWidget(QWidget):
         self.granularity_combo.setCurrentIndex(index)
         self.granularity_combo.blockSignals(False)
 
+    def _schedule_settings_update(self, *args):
+        """(Re)start the delayed settings update."""
+        self._settings_timer.start()
+
     def _on_settings_changed(self):
         """Handle any settings change."""
         self._update_chart()
@@ -245,10 +367,38 @@ class GuidingChartWidget(QWidget):
 
     def _update_chart(self):
         """Update the chart with current data and granularity."""
-        self.plot_widget.clear()
+        # Suspend auto-ranging so adding and moving items doesn't refit the
+        # view for each one; restoring it refits once
+        view_box = self.plot_widget.getViewBox()
+        auto_x, auto_y = view_box.autoRangeEnabled()
+        view_box.disableAutoRange()
+        try:
+            for curve in self._curves:
+                self.plot_widget.removeItem(curve)
+            self._curves = []
+
+            dither_regions, af_times, flip_times = self._plot_data()
+            self._place_markers(self._dither_regions, dither_regions,
+                                self._make_dither_region, pg.LinearRegionItem.setRegion)
+            self._place_markers(self._af_lines, af_times,
+                                self._make_autofocus_line, pg.InfiniteLine.setValue)
+            self._place_markers(self._flip_lines, flip_times,
+                                self._make_flip_line, pg.InfiniteLine.setValue)
+        finally:
+            view_box.enableAutoRange(x=auto_x, y=auto_y)
+
+    def _plot_data(self) -> tuple[list, list, list]:
+        """Plot the RMS curves.
+
+        Returns the dither regions, autofocus times and meridian flip times
+        to mark on the chart.
+        """
+        dither_regions: list[tuple[float, float]] = []
+        af_times: list[float] = []
+        flip_times: list[float] = []
 
         if not self._phd2_parser:
-            return
+            return dither_regions, af_times, flip_times
 
         interval = self._get_granularity_seconds()
         dither_margin = self.get_dither_margin()
@@ -259,71 +409,107 @@ class GuidingChartWidget(QWidget):
         if self._nina_parser and exclude_dither:
             dither_events = self._nina_parser.dither_events
 
-        # Get RMS data, optionally excluding dither periods
-        rms_data = self._phd2_parser.get_rms_over_time(
-            interval,
-            dither_events=dither_events,
-            dither_margin_seconds=dither_margin
-        )
-
-        if not rms_data:
-            return
+        series = self._rms_series(interval, dither_events, dither_margin)
+        if series is None:
+            return dither_regions, af_times, flip_times
 
-        # Convert to arrays for plotting - use actual timestamps
-        times = [d[0].timestamp() for d in rms_data]  # Unix timestamps
-        ra_rms = [d[1] for d in rms_data]
-        dec_rms = [d[2] for d in rms_data]
-        total_rms = [d[3] for d in rms_data]
+        times = series['t']  # Unix timestamps
+        ra_rms = series['ra']
+        dec_rms = series['dec']
+        total_rms = series['total']
 
-        min_time = min(times) if times else 0
-        max_time = max(times) if times else 1
+        min_time = times.min()
+        max_time = times.max()
 
         # Plot lines
-        pen_ra = pg.mkPen(color='#2196F3', width=2)
-        pen_dec = pg.mkPen(color='#4CAF50', width=2)
-        pen_total = pg.mkPen(color='#F44336', width=2)
+        self._curves = [
+            self.plot_widget.plot(times, ra_rms, pen=self._PEN_RA, name='RA RMS'),
+            self.plot_widget.plot(times, dec_rms, pen=self._PEN_DEC, name='Dec RMS'),
+            self.plot_widget.plot(times, total_rms, pen=self._PEN_TOTAL, name='Total RMS'),
+        ]
 
-        self.plot_widget.plot(times, ra_rms, pen=pen_ra, name='RA RMS')
-        self.plot_widget.plot(times, dec_rms, pen=pen_dec, name='Dec RMS')
-        self.plot_widget.plot(times, total_rms, pen=pen_total, name='Total RMS')
-
-        # Add event markers if NINA data available
+        # Event markers if NINA data available
         if self._nina_parser:
+            nina = self._nina_parser
             # Dither markers (shaded regions) - only show if exclusion is enabled
-            if exclude_dither:
-                for dither in self._nina_parser.dither_events:
-                    dither_start = dither.start_time.timestamp() - dither_margin
-                    dither_end = (dither.end_time or dither.start_time).timestamp() + dither_margin
-
-                    if min_time <= dither_start <= max_time or min_time <= dither_end <= max_time:
-                        # Create a shaded region for dither
-                        region = pg.LinearRegionItem(
-                            values=[dither_start, dither_end],
-                            brush=pg.mkBrush(255, 193, 7, 50),  # Yellow with transparency
-                            pen=pg.mkPen(None),
-                            movable=False
-                        )
-                        self.plot_widget.addItem(region)
+            if exclude_dither and nina.dither_events:
+                starts = _timestamps([d.start_time for d in nina.dither_events]) - dither_margin
+                ends = _timestamps([d.end_time or d.start_time for d in nina.dither_events]) + dither_margin
+                # Regions overlapping the plotted time range
+                visible = (starts <= max_time) & (ends >= min_time)
+                dither_regions = list(zip(starts[visible].tolist(), ends[visible].tolist()))
 
             # Autofocus markers
-            for af in self._nina_parser.autofocus_runs:
-                af_time = af.timestamp.timestamp()
-                if min_time <= af_time <= max_time:
-                    line = pg.InfiniteLine(
-                        pos=af_time, angle=90,
-                        pen=pg.mkPen('#9C27B0', width=1, style=Qt.PenStyle.DashLine)
-                    )
-                    self.plot_widget.addItem(line)
+            af_times = _timestamps([af.timestamp for af in nina.autofocus_runs])
+            af_times = af_times[(af_times >= min_time) & (af_times <= max_time)].tolist()
 
             # Meridian flip markers
-            for flip in self._nina_parser.meridian_flips:
-                flip_time = flip.timestamp.timestamp()
-                if min_time <= flip_time <= max_time:
-                    line = pg.InfiniteLine(
-                        pos=flip_time, angle=90,
-                        pen=pg.mkPen('#FF9800', width=2, style=Qt.PenStyle.DashLine)
-                    )
-                    self.plot_widget.addItem(line)
+            flip_times = _timestamps([flip.timestamp for flip in nina.meridian_flips])
+            flip_times = flip_times[(flip_times >= min_time) & (flip_times <= max_time)].tolist()
+
+        return dither_regions, af_times, flip_times
+
+    def _rms_series(self, interval: int, dither_events: Optional[list],
+                    dither_margin: float) -> Optional[np.ndarray]:
+        """Get the RMS series as a record array, or None if there is no data.
+
+        Results are cached until the parsers change.
+        """
+        # The margin only matters when dithers are excluded
+        key = (interval, dither_events is not None,
+               dither_margin if dither_events is not None else None)
+        if key in self._rms_cache:
+            return self._rms_cache[key]
+
+        # Get RMS data, optionally excluding dither periods
+        rms_data = self._phd2_parser.get_rms_over_time(
+            interval,
+            dither_events=dither_events,
+            dither_margin_seconds=dither_margin
+        )
+
+        series = None
+        if rms_data:
+            # Convert to arrays for plotting in one pass - use actual timestamps
+            series = np.fromiter(
+                ((d[0].timestamp(), d[1], d[2], d[3]) for d in rms_data),
+                dtype=[('t', 'f8'), ('ra', 'f8'), ('dec', 'f8'), ('total', 'f8')],
+                count=len(rms_data)
+            )
+        self._rms_cache[key] = series
+        return series
+
+    def _place_markers(self, pool: list, values: list, make_item, set_value) -> None:
+        """Show one pooled marker per value, hiding the unused ones.
+
+        New items are only created when the pool is too small.
+        """
+        for i, value in enumerate(values):
+            if i == len(pool):
+                item = make_item()
+                self.plot_widget.addItem(item)
+                pool.append(item)
+            item = pool[i]
+            set_value(item, value)
+            item.setVisible(True)
+        for item in pool[len(values):]:
+            item.setVisible(False)
+
+    def _make_dither_region(self) -> pg.LinearRegionItem:
+        """Create a shaded region for a dither."""
+        return pg.LinearRegionItem(
+            brush=self._DITHER_BRUSH,
+            pen=self._DITHER_PEN,
+            movable=False
+        )
+
+    def _make_autofocus_line(self) -> pg.InfiniteLine:
+        """Create an autofocus marker line."""
+        return pg.InfiniteLine(angle=90, pen=self._AUTOFOCUS_PEN)
+
+    def _make_flip_line(self) -> pg.InfiniteLine:
+        """Create a meridian flip marker line."""
+        return pg.InfiniteLine(angle=90, pen=self._FLIP_PEN)
 
 
 class HFRChartWidget(QWidget):
@@ -348,12 +534,19 @@ class HFRChartWidget(QWidget):
         self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
         self.plot_widget.setLabel('left', 'HFR', units='px')
         self.plot_widget.setLabel('bottom', 'Sub #')
+        # Only draw the points inside the view; peak downsampling is meant
+        # for lines and would distort the per-sub scatter
+        self.plot_widget.setClipToView(True)
+        self.plot_widget.setAntialiasing(False)
+        # Created once; named plots add their own entries
+        self.legend = self.plot_widget.addLegend()
 
         layout.addWidget(self.plot_widget)
 
     def set_data(self, nina: NINAParser):
         """Set the NINA data to display."""
         self.plot_widget.clear()
+        self.legend.clear()
 
         hfr_data = nina.get_hfr_over_time()
         if not hfr_data:
@@ -361,31 +554,32 @@ class HFRChartWidget(QWidget):
             self.plot_widget.enableAutoRange()
             return
 
-        # Group by filter
-        filters: dict[str, list[tuple[int, float]]] = {}
-        for i, (ts, hfr, filter_name) in enumerate(hfr_data):
-            if filter_name not in filters:
-                filters[filter_name] = []
-            filters[filter_name].append((i + 1, hfr))
+        # Columns of the HFR series; x is the 1-based sub number
+        count = len(hfr_data)
+        x = np.arange(1, count + 1)
+        y = np.fromiter((d[1] for d in hfr_data), dtype=np.float64, count=count)
+        names = np.array([d[2] for d in hfr_data])
+
+        # Filters in order of first appearance, which sets their colors
+        unique_names, first_index = np.unique(names, return_index=True)
+        filter_names = unique_names[np.argsort(first_index)]
 
         # Color palette for filters
         colors = ['#2196F3', '#4CAF50', '#F44336', '#FF9800', '#9C27B0', '#00BCD4']
 
-        for idx, (filter_name, data) in enumerate(filters.items()):
-            x = [d[0] for d in data]
-            y = [d[1] for d in data]
+        for idx, filter_name in enumerate(filter_names):
+            mask = names == filter_name
             color = colors[idx % len(colors)]
 
             self.plot_widget.plot(
-                x, y,
+                x[mask], y[mask],
                 pen=None,
                 symbol='o',
                 symbolSize=8,
                 symbolBrush=color,
-                name=filter_name or 'Unknown'
+                name=str(filter_name) or 'Unknown'
             )
 
-        self.plot_widget.addLegend()
         # Reset zoom/pan to show all data
         self.plot_widget.enableAutoRange()
         self.plot_widget.autoRange()
@@ -418,10 +612,15 @@ class AutofocusTableWidget(QGroupBox):
 
     def set_data(self, nina: NINAParser):
         """Set the NINA data to display."""
+        with _batched_update(self.table):
+            self._populate(nina)
+
+    def _populate(self, nina: NINAParser):
+        """Fill the table with the autofocus runs."""
         if not nina.autofocus_runs:
             self.table.setRowCount(1)
             no_data_item = QTableWidgetItem("No autofocus runs in this session")
-            no_data_item.setForeground(QBrush(QColor("#999")))
+            no_data_item.setForeground(_BRUSH_GREY_FG)
             self.table.setItem(0, 0, no_data_item)
             self.table.setSpan(0, 0, 1, self.table.columnCount())
             return
@@ -430,7 +629,7 @@ class AutofocusTableWidget(QGroupBox):
         self.table.setSpan(0, 0, 1, 1)
 
         for row, af in enumerate(nina.autofocus_runs):
-            self.table.setItem(row, 0, QTableWidgetItem(af.timestamp.strftime("%H:%M:%S")))
+            self.table.setItem(row, 0, QTableWidgetItem(_fmt_hms(af.timestamp)))
             self.table.setItem(row, 1, QTableWidgetItem(af.trigger.replace("AutofocusAfter", "")))
             self.table.setItem(row, 2, QTableWidgetItem(af.filter_name))
             self.table.setItem(row, 3, QTableWidgetItem(str(af.final_position)))
@@ -438,96 +637,204 @@ class AutofocusTableWidget(QGroupBox):
             self.table.setItem(row, 5, QTableWidgetItem(f"{af.temperature:.1f}°" if af.temperature else "-"))
 
 
+class ExposuresModel(QAbstractTableModel):
+    """Table model over the NINA exposures, formatting cells on demand."""
+
+    HEADERS = (
+        "Time", "Filter", "Exp", "HFR", "Stars",
+        "RA RMS", "Dec RMS", "Total RMS", "Img Px", "Frames"
+    )
+    PLACEHOLDER = "No LIGHT frames saved in this session"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # None until data is set; an empty list shows the placeholder row
+        self._exposures: Optional[list[Exposure]] = None
+        self._imaging_pixel_scale = 1.0  # arcsec/px
+
+    def set_exposures(self, exposures: list[Exposure]) -> None:
+        """Show the given exposures (the list is held by reference)."""
+        self.beginResetModel()
+        self._exposures = exposures
+        self.endResetModel()
+
+    def set_imaging_pixel_scale(self, scale: float) -> None:
+        """Set the imaging system pixel scale for RMS color coding."""
+        self._imaging_pixel_scale = scale
+        if self._exposures:
+            self.dataChanged.emit(
+                self.index(0, 5), self.index(len(self._exposures) - 1, 8)
+            )
+
+    def is_placeholder(self) -> bool:
+        """Whether the model shows the "no exposures" row."""
+        return self._exposures is not None and not self._exposures
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid() or self._exposures is None:
+            return 0
+        return len(self._exposures) or 1
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+
+        if not self._exposures:
+            if column == 0:
+                if role == Qt.ItemDataRole.DisplayRole:
+                    return self.PLACEHOLDER
+                if role == Qt.ItemDataRole.ForegroundRole:
+                    return _BRUSH_GREY_FG
+            return None
+
+        exp = self._exposures[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_text(exp, column)
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._background(exp, column)
+        return None
+
+    def _display_text(self, exp: Exposure, column: int) -> str:
+        """Format one cell of an exposure row."""
+        if column == 0:
+            return _fmt_hms(exp.timestamp)
+        if column == 1:
+            return exp.filter_name
+        if column == 2:
+            return f"{exp.exposure_time:.0f}s"
+        if column == 3:
+            return f"{exp.hfr:.2f}" if exp.hfr else "-"
+        if column == 4:
+            return str(exp.stars_detected) if exp.stars_detected else "-"
+        if column == 5:
+            return f"{exp.ra_rms:.2f}\"" if exp.ra_rms else "-"
+        if column == 6:
+            return f"{exp.dec_rms:.2f}\"" if exp.dec_rms else "-"
+        if column == 7:
+            return f"{exp.total_rms:.2f}\"" if exp.total_rms else "-"
+        if column == 8:
+            # Error in imaging pixels
+            if exp.total_rms and self._imaging_pixel_scale > 0:
+                return f"{exp.total_rms / self._imaging_pixel_scale:.2f} px"
+            return "-"
+        return str(exp.guiding_frames) if exp.guiding_frames else "-"
+
+    def _background(self, exp: Exposure, column: int) -> Optional[QBrush]:
+        """Background brush for one cell of an exposure row."""
+        if column == 3:
+            if exp.hfr and exp.hfr > 3.0:  # Highlight high HFR
+                return _BRUSH_RED
+            return None
+        if 5 <= column <= 8 and exp.total_rms and self._imaging_pixel_scale > 0:
+            # Color code the guiding columns by the error in imaging pixels:
+            # green < 1 px, yellow 1-2 px, red > 2 px
+            img_pixels = exp.total_rms / self._imaging_pixel_scale
+            if img_pixels < 1.0:
+                return _BRUSH_GREEN
+            if img_pixels < 2.0:
+                return _BRUSH_YELLOW
+            return _BRUSH_RED
+        return None
+
+
 class ExposuresTableWidget(QGroupBox):
     """Table widget displaying exposures/subs."""
 
     def __init__(self, parent=None):
         super().__init__("Exposures", parent)
-        self._imaging_pixel_scale = 1.0  # arcsec/px
         self._setup_ui()
 
     def set_imaging_pixel_scale(self, scale: float) -> None:
         """Set the imaging system pixel scale for RMS color coding."""
-        self._imaging_pixel_scale = scale
+        self.model.set_imaging_pixel_scale(scale)
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(10)
-        self.table.setHorizontalHeaderLabels([
-            "Time", "Filter", "Exp", "HFR", "Stars",
-            "RA RMS", "Dec RMS", "Total RMS", "Img Px", "Frames"
-        ])
+        self.model = ExposuresModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
 
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
 
         layout.addWidget(self.table)
 
     def set_data(self, nina: NINAParser):
         """Set the NINA data to display."""
-        if not nina.exposures:
-            self.table.setRowCount(1)
-            no_data_item = QTableWidgetItem("No LIGHT frames saved in this session")
-            no_data_item.setForeground(QBrush(QColor("#999")))
-            self.table.setItem(0, 0, no_data_item)
-            self.table.setSpan(0, 0, 1, self.table.columnCount())
-            return
+        # Rows are formatted lazily by the model as they are painted
+        self.model.set_exposures(nina.exposures)
+        self.table.clearSpans()
+        if self.model.is_placeholder():
+            self.table.setSpan(0, 0, 1, self.model.columnCount())
 
-        self.table.setRowCount(len(nina.exposures))
-        # Clear any previous span
-        self.table.setSpan(0, 0, 1, 1)
-
-        for row, exp in enumerate(nina.exposures):
-            self.table.setItem(row, 0, QTableWidgetItem(exp.timestamp.strftime("%H:%M:%S")))
-            self.table.setItem(row, 1, QTableWidgetItem(exp.filter_name))
-            self.table.setItem(row, 2, QTableWidgetItem(f"{exp.exposure_time:.0f}s"))
 
-            hfr_item = QTableWidgetItem(f"{exp.hfr:.2f}" if exp.hfr else "-")
-            if exp.hfr and exp.hfr > 3.0:  # Highlight high HFR
-                hfr_item.setBackground(QBrush(QColor("#FFCDD2")))
-            self.table.setItem(row, 3, hfr_item)
+class EventsModel(QAbstractTableModel):
+    """Table model over session events, formatting cells on demand."""
 
-            self.table.setItem(row, 4, QTableWidgetItem(str(exp.stars_detected) if exp.stars_detected else "-"))
+    HEADERS = ("Time", "Type", "Details")
 
-            # Guiding RMS columns
-            ra_item = QTableWidgetItem(f"{exp.ra_rms:.2f}\"" if exp.ra_rms else "-")
-            dec_item = QTableWidgetItem(f"{exp.dec_rms:.2f}\"" if exp.dec_rms else "-")
-            total_item = QTableWidgetItem(f"{exp.total_rms:.2f}\"" if exp.total_rms else "-")
-
-            # Calculate error in imaging pixels
-            if exp.total_rms and self._imaging_pixel_scale > 0:
-                img_pixels = exp.total_rms / self._imaging_pixel_scale
-                img_px_item = QTableWidgetItem(f"{img_pixels:.2f} px")
-
-                # Color code based on imaging pixels:
-                # Green: < 1 px (sub-pixel, no visible error)
-                # Yellow: 1-2 px (marginal, may be visible)
-                # Red: > 2 px (definitely visible trailing)
-                if img_pixels < 1.0:
-                    bg_color = QColor("#C8E6C9")  # Light green
-                elif img_pixels < 2.0:
-                    bg_color = QColor("#FFF9C4")  # Light yellow
-                else:
-                    bg_color = QColor("#FFCDD2")  # Light red
-
-                for item in [ra_item, dec_item, total_item, img_px_item]:
-                    item.setBackground(QBrush(bg_color))
-            else:
-                img_px_item = QTableWidgetItem("-")
-
-            frames_item = QTableWidgetItem(str(exp.guiding_frames) if exp.guiding_frames else "-")
-
-            self.table.setItem(row, 5, ra_item)
-            self.table.setItem(row, 6, dec_item)
-            self.table.setItem(row, 7, total_item)
-            self.table.setItem(row, 8, img_px_item)
-            self.table.setItem(row, 9, frames_item)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Column-wise event data in display order
+        self._times: list[datetime] = []
+        self._types: list[str] = []
+        self._details: list[str] = []
+        self._brushes: list[QBrush] = []
+
+    def set_events(self, events: list[tuple[datetime, str, str, QBrush]]) -> None:
+        """Show the given (time, type, details, brush) events sorted by time."""
+        self.beginResetModel()
+        if events:
+            times, types, details, brushes = zip(*events)
+            # Stable sort on the naive timestamps keeps the input order of ties
+            order = np.argsort(np.array(times, dtype='datetime64[us]'), kind='stable')
+            self._times = [times[i] for i in order]
+            self._types = [types[i] for i in order]
+            self._details = [details[i] for i in order]
+            self._brushes = [brushes[i] for i in order]
+        else:
+            self._times, self._types, self._details, self._brushes = [], [], [], []
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._times)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            column = index.column()
+            if column == 0:
+                return _fmt_hms(self._times[row])
+            if column == 1:
+                return self._types[row]
+            return self._details[row]
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._brushes[row]
+        return None
 
 
 class EventsListWidget(QGroupBox):
@@ -540,9 +847,9 @@ class EventsListWidget(QGroupBox):
     def _setup_ui(self):
         layout = QVBoxLayout(self)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Time", "Type", "Details"])
+        self.model = EventsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
@@ -550,13 +857,13 @@ class EventsListWidget(QGroupBox):
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
 
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
 
         layout.addWidget(self.table)
 
     def set_data(self, phd2: Optional[PHD2Parser], nina: Optional[NINAParser]):
         """Set the data to display."""
-        events: list[tuple[datetime, str, str, str]] = []  # (time, type, details, color)
+        events: list[tuple[datetime, str, str, QBrush]] = []  # (time, type, details, brush)
 
         if nina:
             # Autofocus events
@@ -564,8 +871,8 @@ class EventsListWidget(QGroupBox):
                 events.append((
                     af.timestamp,
                     "Autofocus",
-                    f"{af.filter_name} - HFR: {af.final_hfr:.2f}" if af.final_hfr else af.filter_name,
-                    "#E1BEE7"
+                    _FMT_AUTOFOCUS(af.filter_name, af.final_hfr) if af.final_hfr else af.filter_name,
+                    _BRUSH_EVENT_AUTOFOCUS
                 ))
 
             # Filter changes
@@ -573,8 +880,8 @@ class EventsListWidget(QGroupBox):
                 events.append((
                     fc.timestamp,
                     "Filter",
-                    f"Changed to {fc.filter_name}",
-                    "#B3E5FC"
+                    _FMT_FILTER(fc.filter_name),
+                    _BRUSH_EVENT_FILTER
                 ))
 
             # Meridian flips
@@ -582,8 +889,8 @@ class EventsListWidget(QGroupBox):
                 events.append((
                     flip.timestamp,
                     "Meridian Flip",
-                    f"{flip.from_pier_side} -> {flip.to_pier_side}",
-                    "#FFE0B2"
+                    _FMT_FLIP(flip.from_pier_side, flip.to_pier_side),
+                    _BRUSH_EVENT_FLIP
                 ))
 
             # RMS alerts
@@ -591,18 +898,17 @@ class EventsListWidget(QGroupBox):
                 events.append((
                     alert.timestamp,
                     "RMS Alert",
-                    f"Total: {alert.total_rms:.2f}\" (threshold: {alert.threshold}\")",
-                    "#FFCDD2"
+                    _FMT_RMS_ALERT(alert.total_rms, alert.threshold),
+                    _BRUSH_EVENT_ALERT
                 ))
 
             # Dither events
             for dither in nina.dither_events:
-                duration = dither.duration_seconds
                 events.append((
                     dither.start_time,
                     "Dither",
-                    f"Duration: {duration:.1f}s",
-                    "#FFF9C4"  # Light yellow
+                    _FMT_DITHER(dither.duration_seconds),
+                    _BRUSH_EVENT_DITHER
                 ))
 
         if phd2:
@@ -611,34 +917,37 @@ class EventsListWidget(QGroupBox):
                 events.append((
                     session.start_time,
                     "Guiding Start",
-                    f"Pier: {session.pier_side}, Alt: {session.altitude:.1f}°",
-                    "#C8E6C9"
+                    _FMT_GUIDING_START(session.pier_side, session.altitude),
+                    _BRUSH_EVENT_GUIDING_START
                 ))
                 if session.end_time:
                     events.append((
                         session.end_time,
                         "Guiding End",
-                        f"RMS: {session.total_rms:.2f}\"",
-                        "#FFCCBC"
+                        _FMT_GUIDING_END(session.total_rms),
+                        _BRUSH_EVENT_GUIDING_END
                     ))
 
-        # Sort by time
-        events.sort(key=lambda x: x[0])
+        # The model sorts by time and formats rows as they are painted
+        self.model.set_events(events)
+
+
+class RMSHighlightDelegate(QStyledItemDelegate):
+    """Item delegate highlighting RMS cells above a threshold.
 
-        self.table.setRowCount(len(events))
-        for row, (time, event_type, details, color) in enumerate(events):
-            time_item = QTableWidgetItem(time.strftime("%H:%M:%S"))
-            type_item = QTableWidgetItem(event_type)
-            details_item = QTableWidgetItem(details)
+    The RMS value is read from the item's UserRole data, so the items
+    themselves carry no background brush.
+    """
 
-            bg = QBrush(QColor(color))
-            time_item.setBackground(bg)
-            type_item.setBackground(bg)
-            details_item.setBackground(bg)
+    def __init__(self, threshold: float, parent=None):
+        super().__init__(parent)
+        self._threshold = threshold
 
-            self.table.setItem(row, 0, time_item)
-            self.table.setItem(row, 1, type_item)
-            self.table.setItem(row, 2, details_item)
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        value = index.data(Qt.ItemDataRole.UserRole)
+        if value is not None and value > self._threshold:
+            option.backgroundBrush = _BRUSH_RED
 
 
 class GuidingSessionsTableWidget(QGroupBox):
@@ -664,36 +973,72 @@ class GuidingSessionsTableWidget(QGroupBox):
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
 
+        # Highlight RA/Dec RMS above 1" and total RMS above 1.5"
+        self.table.setItemDelegateForColumn(3, RMSHighlightDelegate(1.0, self.table))
+        self.table.setItemDelegateForColumn(4, RMSHighlightDelegate(1.0, self.table))
+        self.table.setItemDelegateForColumn(5, RMSHighlightDelegate(1.5, self.table))
+
         layout.addWidget(self.table)
 
     def set_data(self, phd2: PHD2Parser):
         """Set the PHD2 data to display."""
+        with _batched_update(self.table):
+            self._populate(phd2)
+
+    def _populate(self, phd2: PHD2Parser):
+        """Fill the table with the guiding sessions."""
         self.table.setRowCount(len(phd2.sessions))
 
         for row, session in enumerate(phd2.sessions):
-            self.table.setItem(row, 0, QTableWidgetItem(session.start_time.strftime("%H:%M:%S")))
+            self.table.setItem(row, 0, QTableWidgetItem(_fmt_hms(session.start_time)))
 
             duration_mins = session.duration_seconds / 60
             self.table.setItem(row, 1, QTableWidgetItem(f"{duration_mins:.1f}m"))
 
             self.table.setItem(row, 2, QTableWidgetItem(session.pier_side))
 
-            ra_item = QTableWidgetItem(f"{session.ra_rms:.2f}\"")
-            if session.ra_rms > 1.0:
-                ra_item.setBackground(QBrush(QColor("#FFCDD2")))
-            self.table.setItem(row, 3, ra_item)
+            # RMS values go in UserRole for the highlight delegates
+            for column, rms in ((3, session.ra_rms), (4, session.dec_rms), (5, session.total_rms)):
+                rms_item = QTableWidgetItem(f"{rms:.2f}\"")
+                rms_item.setData(Qt.ItemDataRole.UserRole, float(rms))
+                self.table.setItem(row, column, rms_item)
+
+            self.table.setItem(row, 6, QTableWidgetItem(str(session.frame_count)))
 
-            dec_item = QTableWidgetItem(f"{session.dec_rms:.2f}\"")
-            if session.dec_rms > 1.0:
-                dec_item.setBackground(QBrush(QColor("#FFCDD2")))
-            self.table.setItem(row, 4, dec_item)
 
-            total_item = QTableWidgetItem(f"{session.total_rms:.2f}\"")
-            if session.total_rms > 1.5:
-                total_item.setBackground(QBrush(QColor("#FFCDD2")))
-            self.table.setItem(row, 5, total_item)
+class _ScanSignals(QObject):
+    """Signals for _ScanJob (QRunnable is not a QObject)."""
 
-            self.table.setItem(row, 6, QTableWidgetItem(str(len(session.frames))))
+    sessionsFound = pyqtSignal(list)  # matching DiscoveredSessions
+    finished = pyqtSignal()
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class _ScanJob(QRunnable):
+    """Scans the log folders on a QThreadPool worker thread."""
+
+    def __init__(self, finder):
+        super().__init__()
+        self.signals = _ScanSignals()
+        self._finder = finder
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Ask the scan to stop; it then emits cancelled."""
+        self._cancel_event.set()
+
+    def run(self):
+        try:
+            sessions = self._finder.get_matching_sessions(self._cancel_event)
+        except ScanCancelled:
+            self.signals.cancelled.emit()
+            return
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.sessionsFound.emit(sessions)
+        self.signals.finished.emit()
 
 
 class SessionSelectorDialog(QDialog):
@@ -710,6 +1055,7 @@ class SessionSelectorDialog(QDialog):
         self._selected_session = None
         self._selected_nina_log: Optional[Path] = None
         self._selected_phd2_log: Optional[Path] = None
+        self._scan_job: Optional[_ScanJob] = None
 
         self._setup_ui()
 
@@ -742,10 +1088,16 @@ class SessionSelectorDialog(QDialog):
         phd2_row.addWidget(phd2_browse_btn)
         folders_layout.addRow("PHD2 Logs:", phd2_row)
 
-        # Scan button
+        # Scan and cancel buttons; the scan runs in the background
+        scan_row = QHBoxLayout()
         self.scan_btn = QPushButton("Scan for Sessions")
         self.scan_btn.clicked.connect(self._scan_folders)
-        folders_layout.addRow("", self.scan_btn)
+        scan_row.addWidget(self.scan_btn)
+        self.cancel_scan_btn = QPushButton("Cancel")
+        self.cancel_scan_btn.setEnabled(False)
+        self.cancel_scan_btn.clicked.connect(self._cancel_scan)
+        scan_row.addWidget(self.cancel_scan_btn)
+        folders_layout.addRow("", scan_row)
 
         layout.addWidget(folders_group)
 
@@ -810,8 +1162,6 @@ class SessionSelectorDialog(QDialog):
             self.phd2_folder_edit.setText(str(self._phd2_folder))
 
     def _scan_folders(self):
-        from parsers import SessionFinder
-
         if not self._nina_folder and not self._phd2_folder:
             QMessageBox.warning(
                 self, "No Folders Selected",
@@ -819,22 +1169,75 @@ class SessionSelectorDialog(QDialog):
             )
             return
 
-        finder = SessionFinder(self._nina_folder, self._phd2_folder)
-        self._sessions = finder.get_matching_sessions()
+        # Report a missing folder here instead of scanning nothing
+        for label, folder in (("NINA", self._nina_folder), ("PHD2", self._phd2_folder)):
+            if folder and not folder.is_dir():
+                QMessageBox.warning(
+                    self, "Folder Not Found",
+                    f"The {label} logs folder does not exist:\n\n{folder}"
+                )
+                return
+
+        if self._scan_job is not None:
+            return  # Already scanning
+
+        self._clear_sessions()
+
+        job = _ScanJob(SessionFinder(self._nina_folder, self._phd2_folder))
+        job.signals.sessionsFound.connect(self._append_sessions)
+        job.signals.finished.connect(self._on_scan_finished)
+        job.signals.failed.connect(self._on_scan_failed)
+        job.signals.cancelled.connect(self._on_scan_cancelled)
+        self._scan_job = job
+        self._set_scanning(True)
+        QThreadPool.globalInstance().start(job)
+
+    def _cancel_scan(self):
+        if self._scan_job is not None:
+            self._scan_job.cancel()
+
+    def _set_scanning(self, scanning: bool):
+        """Toggle the scan buttons while a background scan is running."""
+        self.scan_btn.setEnabled(not scanning)
+        self.scan_btn.setText("Scanning..." if scanning else "Scan for Sessions")
+        self.cancel_scan_btn.setEnabled(scanning)
+
+    def _on_scan_finished(self):
+        self._scan_job = None
+        self._set_scanning(False)
+        if not self._sessions:
+            self.sessions_list.addItem("No matching sessions found")
 
-        self.sessions_list.clear()
+    def _on_scan_failed(self, message: str):
+        self._scan_job = None
+        self._set_scanning(False)
+        QMessageBox.warning(self, "Scan Failed", f"Could not scan the log folders:\n\n{message}")
+
+    def _on_scan_cancelled(self):
+        self._scan_job = None
+        self._set_scanning(False)
+
+    def _clear_sessions(self):
+        """Empty the session list before a new scan."""
+        self._sessions = []
+        self._selected_session = None
+
+        # Signals are blocked while clearing, so reset the selection state here
         self.nina_log_combo.clear()
         self.phd2_log_combo.clear()
+        self.ok_button.setEnabled(False)
 
-        if not self._sessions:
-            self.sessions_list.addItem("No matching sessions found")
-            self.ok_button.setEnabled(False)
-            return
+        with _quiet_update(self.sessions_list):
+            self.sessions_list.clear()
 
-        for session in self._sessions:
-            item = QListWidgetItem(session.display_name)
-            item.setData(Qt.ItemDataRole.UserRole, session)
-            self.sessions_list.addItem(item)
+    def _append_sessions(self, sessions: list):
+        """Add the sessions found by the scan."""
+        self._sessions.extend(sessions)
+        with _quiet_update(self.sessions_list):
+            for session in sessions:
+                item = QListWidgetItem(session.display_name)
+                item.setData(Qt.ItemDataRole.UserRole, session)
+                self.sessions_list.addItem(item)
 
     def _on_session_selected(self):
         selected_items = self.sessions_list.selectedItems()
@@ -847,23 +1250,35 @@ class SessionSelectorDialog(QDialog):
             self.ok_button.setEnabled(False)
             return
 
+        # The combos already list this session's logs
+        if session is self._selected_session:
+            self.ok_button.setEnabled(True)
+            return
+
         self._selected_session = session
 
         # Populate NINA log combo
-        self.nina_log_combo.clear()
-        for log in sorted(session.nina_logs):
-            self.nina_log_combo.addItem(log.name, log)
+        with _quiet_update(self.nina_log_combo):
+            self.nina_log_combo.clear()
+            for log in session.nina_logs:
+                self.nina_log_combo.addItem(log.name, log)
 
         # Populate PHD2 log combo
-        self.phd2_log_combo.clear()
-        for log in sorted(session.phd2_logs):
-            self.phd2_log_combo.addItem(log.name, log)
+        with _quiet_update(self.phd2_log_combo):
+            self.phd2_log_combo.clear()
+            for log in session.phd2_logs:
+                self.phd2_log_combo.addItem(log.name, log)
 
         self.ok_button.setEnabled(True)
 
     def _on_session_double_clicked(self, item):
         self._on_accept()
 
+    def done(self, result):
+        # Stop a running scan when the dialog is closed
+        self._cancel_scan()
+        super().done(result)
+
     def _on_accept(self):
         if self.nina_log_combo.currentIndex() >= 0:
             self._selected_nina_log = self.nina_log_combo.currentData()